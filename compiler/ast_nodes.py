@@ -10,8 +10,8 @@ PEL Abstract Syntax Tree (AST) Node Definitions
 """
 
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any
+from enum import Enum, IntEnum
+from typing import Any, ClassVar
 
 
 class NodeType(Enum):
@@ -24,16 +24,75 @@ class NodeType(Enum):
     POLICY = "policy"
 
 
-@dataclass
+class OpKind(IntEnum):
+    """Binary operator kinds, resolved once from the operator symbol."""
+    UNKNOWN = 0
+    ADD = 1
+    SUB = 2
+    MUL = 3
+    DIV = 4
+    MOD = 5
+    POW = 6
+    EQ = 7
+    NE = 8
+    LT = 9
+    LE = 10
+    GT = 11
+    GE = 12
+    AND = 13
+    OR = 14
+
+
+OPERATOR_KINDS: dict[str, OpKind] = {
+    "+": OpKind.ADD,
+    "-": OpKind.SUB,
+    "*": OpKind.MUL,
+    "/": OpKind.DIV,
+    "%": OpKind.MOD,
+    "^": OpKind.POW,
+    "==": OpKind.EQ,
+    "!=": OpKind.NE,
+    "<": OpKind.LT,
+    "<=": OpKind.LE,
+    ">": OpKind.GT,
+    ">=": OpKind.GE,
+    "&&": OpKind.AND,
+    "||": OpKind.OR,
+}
+
+
+class ExprKind(IntEnum):
+    """Expression node kinds, exposed on each class as NODE_KIND."""
+    UNKNOWN = 0
+    LITERAL = 1
+    VARIABLE = 2
+    BINARY_OP = 3
+    UNARY_OP = 4
+    FUNCTION_CALL = 5
+    INDEXING = 6
+    ARRAY_LITERAL = 7
+    LAMBDA = 8
+    MEMBER_ACCESS = 9
+    IF_THEN_ELSE = 10
+    PER_DURATION = 11
+    DISTRIBUTION = 12
+    BLOCK = 13
+
+
+@dataclass(slots=True)
 class ASTNode:
     """Base class for all AST nodes."""
     line: int = field(default=0, kw_only=True)
     column: int = field(default=0, kw_only=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeAnnotation(ASTNode):
-    """Type annotation."""
+    """Type annotation.
+
+    Slotted: every declaration carries one, and the checker adds one to
+    each var it infers a type for.
+    """
     type_kind: str  # Currency, Rate, Duration, etc.
     params: dict[str, Any] = field(default_factory=dict)  # e.g., {"currency_code": "USD"}
 
@@ -41,7 +100,7 @@ class TypeAnnotation(ASTNode):
 @dataclass
 class Expression(ASTNode):
     """Base class for expressions."""
-    pass
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.UNKNOWN
 
 
 @dataclass
@@ -53,6 +112,7 @@ class Statement(ASTNode):
 @dataclass
 class Literal(Expression):
     """Literal value."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.LITERAL
     value: Any
     literal_type: str | None = None
 
@@ -60,20 +120,27 @@ class Literal(Expression):
 @dataclass
 class Variable(Expression):
     """Variable reference."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.VARIABLE
     name: str
 
 
 @dataclass
 class BinaryOp(Expression):
     """Binary operation (e.g., a + b)."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.BINARY_OP
     operator: str
     left: Expression
     right: Expression
+    operator_kind: OpKind = field(default=OpKind.UNKNOWN, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.operator_kind = OPERATOR_KINDS.get(self.operator, OpKind.UNKNOWN)
 
 
 @dataclass
 class UnaryOp(Expression):
     """Unary operation (e.g., -x)."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.UNARY_OP
     operator: str
     operand: Expression
 
@@ -81,6 +148,7 @@ class UnaryOp(Expression):
 @dataclass
 class FunctionCall(Expression):
     """Function call."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.FUNCTION_CALL
     function_name: str
     arguments: list[Expression]
 
@@ -88,6 +156,7 @@ class FunctionCall(Expression):
 @dataclass
 class Indexing(Expression):
     """Array/TimeSeries indexing (e.g., revenue[t])."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.INDEXING
     expression: Expression  # Changed from 'base' to match parser
     index: Expression
 
@@ -95,12 +164,14 @@ class Indexing(Expression):
 @dataclass
 class ArrayLiteral(Expression):
     """Array literal expression [1, 2, 3]."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.ARRAY_LITERAL
     elements: list[Expression]
 
 
 @dataclass
 class Lambda(Expression):
     """Lambda expression (x: T) -> expr."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.LAMBDA
     params: list[tuple]  # [(name, type), ...]
     body: Expression
 
@@ -108,6 +179,7 @@ class Lambda(Expression):
 @dataclass
 class MemberAccess(Expression):
     """Member access expression (e.g., obj.field)."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.MEMBER_ACCESS
     expression: Expression
     member: str
 
@@ -115,6 +187,7 @@ class MemberAccess(Expression):
 @dataclass
 class IfThenElse(Expression):
     """Conditional expression."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.IF_THEN_ELSE
     condition: Expression
     then_expr: Expression  # Changed from 'then_branch'
     else_expr: Expression  # Changed from 'else_branch'
@@ -123,6 +196,7 @@ class IfThenElse(Expression):
 @dataclass
 class PerDurationExpression(Expression):
     """Expression for per-duration operations (e.g., $500 / 1mo)."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.PER_DURATION
     left: Expression
     duration: str
 
@@ -130,6 +204,7 @@ class PerDurationExpression(Expression):
 @dataclass
 class Distribution(Expression):
     """Distribution expression (e.g., ~Normal(μ=0, σ=1))."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.DISTRIBUTION
     dist_type: str  # Changed from 'distribution_type' to match parser
     params: dict[str, Expression]  # Changed from 'parameters'
 
@@ -167,6 +242,7 @@ class ForStmt(Statement):
 @dataclass
 class BlockExpr(Expression):
     """Block expression (e.g., { ... return expr })."""
+    NODE_KIND: ClassVar[ExprKind] = ExprKind.BLOCK
     statements: list[Statement] = field(default_factory=list)
 
 
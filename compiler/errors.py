@@ -10,6 +10,7 @@ PEL Compiler Error System
 Implements error reporting with codes E0xxx from language spec
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
 
@@ -26,20 +27,46 @@ class SourceLocation:
 
 
 class CompilerError(Exception):
-    """Base class for all compilation errors."""
+    """Base class for all compilation errors.
+
+    `message` may be a zero-argument callable, in which case it is only
+    formatted the first time the message (or the error) is turned into text.
+    """
 
     def __init__(
         self,
         code: str,
-        message: str,
+        message: str | Callable[[], str],
         location: SourceLocation | None = None,
         hint: str | None = None
     ) -> None:
         self.code = code
-        self.message = message
+        self._message = message
         self.location = location
         self.hint = hint
-        super().__init__(self._format())
+        super().__init__()
+
+    @property
+    def message(self) -> str:
+        """Error message, formatted on first access if it was deferred."""
+        if callable(self._message):
+            self._message = self._message()
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+
+    @property
+    def args(self) -> tuple[str]:  # type: ignore[override]
+        """The formatted error, so args always matches str(self)."""
+        return (self._format(),)
+
+    def __str__(self) -> str:
+        return self._format()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._format()!r})"
 
     def _format(self) -> str:
         """Format error message."""
@@ -93,11 +120,14 @@ class TypeError(CompilerError):
     pass
 
 
-def type_mismatch(expected: str, got: str, location: SourceLocation | None = None) -> TypeError:
-    """E0100: Type mismatch."""
+def type_mismatch(expected: object, got: object, location: SourceLocation | None = None) -> TypeError:
+    """E0100: Type mismatch.
+
+    `expected` and `got` are only converted to text when the message is read.
+    """
     return TypeError(
         "E0100",
-        f"Type mismatch: expected {expected}, got {got}",
+        lambda: f"Type mismatch: expected {expected}, got {got}",
         location
     )
 
@@ -119,11 +149,14 @@ class DimensionalError(CompilerError):
     pass
 
 
-def dimensional_mismatch(op: str, left: str, right: str, location: SourceLocation | None = None) -> DimensionalError:
-    """E0200: Dimensional mismatch."""
+def dimensional_mismatch(op: str, left: object, right: object, location: SourceLocation | None = None) -> DimensionalError:
+    """E0200: Dimensional mismatch.
+
+    `left` and `right` are only converted to text when the message is read.
+    """
     return DimensionalError(
         "E0200",
-        f"Cannot {op} incompatible dimensions: {left} and {right}",
+        lambda: f"Cannot {op} incompatible dimensions: {left} and {right}",
         location,
         hint="Arithmetic requires compatible units (e.g., Currency + Currency, not Currency + Rate)"
     )
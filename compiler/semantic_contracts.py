@@ -120,6 +120,8 @@ class SemanticContracts:
 
     # Storage for all registered contracts
     _contracts: dict[str, SemanticContract] = {}
+    # find_conversions results by (source, target); cleared on register
+    _conversion_cache: dict[tuple[str, str], tuple[SemanticContract, ...]] = {}
 
     @classmethod
     def register(cls, contract: SemanticContract) -> None:
@@ -127,6 +129,7 @@ class SemanticContracts:
         if contract.name in cls._contracts:
             raise ValueError(f"Contract '{contract.name}' is already registered")
         cls._contracts[contract.name] = contract
+        cls._conversion_cache.clear()
 
     @classmethod
     def get(cls, name: str) -> SemanticContract | None:
@@ -136,11 +139,14 @@ class SemanticContracts:
     @classmethod
     def find_conversions(cls, source_type: str, target_type: str) -> list:
         """Find all contracts that allow conversion from source to target type."""
-        matches = []
-        for contract in cls._contracts.values():
-            if contract.matches(source_type, target_type):
-                matches.append(contract)
-        return matches
+        key = (source_type, target_type)
+        matches = cls._conversion_cache.get(key)
+        if matches is None:
+            matches = cls._conversion_cache[key] = tuple(
+                contract for contract in cls._contracts.values()
+                if contract.matches(source_type, target_type)
+            )
+        return list(matches)
 
     @classmethod
     def all_contracts(cls) -> list:
@@ -13,9 +13,14 @@ guidance on valid type conversions beyond dimensional correctness. Contracts
 document the business logic and domain assumptions that justify conversions.
 """
 
+import operator
 import re
-from dataclasses import dataclass
-from typing import Any, Optional
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import chain, islice
+from typing import Any, Optional, cast
 
 from compiler.ast_nodes import *
 from compiler.errors import (
@@ -28,8 +33,135 @@ from compiler.errors import (
 )
 from compiler.semantic_contracts import SemanticContracts
 
+# Duration literal syntax ("30d", "18mo", "2w", "1q", "1yr") and the time
+# units each suffix denotes.
+_DURATION_RE = re.compile(r"^(\d+)(d|w|mo|q|yr)$")
+_DURATION_SUFFIX_CHARS = "dwqmoyr"
+_UNIT_MAP = {
+    "d": "Day",
+    "w": "Week",
+    "mo": "Month",
+    "q": "Quarter",
+    "yr": "Year",
+}
+
+
+# Models reuse a handful of distinct durations, so results are cached by text
+@lru_cache(maxsize=1024)
+def _duration_unit(text: str) -> str | None:
+    """Time unit denoted by duration text such as "18mo", or None."""
+    match = _DURATION_RE.match(text) if text[-1:] in _DURATION_SUFFIX_CHARS else None
+    return _UNIT_MAP[match.group(2)] if match else None
+
+
+def _argument_mismatch_message(function_name: str, position: int, expected: object, got: object) -> str:
+    """Deferred text of an E0101 argument type mismatch."""
+    return f"Type mismatch in function '{function_name}' argument {position}: expected {expected}, got {got}"
+
+
+def _index_value(index: Literal) -> int | None:
+    """Value of an integer literal index, or None if it is not a whole number."""
+    value = index.value
+    # The parser stores integer literals as int; nodes built elsewhere may
+    # carry the source text instead
+    if value.__class__ is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
 
-@dataclass
+# Leading number in currency/rate/duration literal text, e.g. "$100.50/1mo".
+_NUMBER_RE = re.compile(r"([+-]?[\d.]+)")
+
+# Instruction set for the postfix programs used by static constraint
+# evaluation (see TypeChecker._static_program).
+_OP_CONST = 0  # push a constant
+_OP_LOAD = 1  # push the static value of a parameter
+_OP_UNARY = 2  # apply a unary operator to the top of the stack
+_OP_BINARY = 3  # apply a binary operator to the top two entries
+
+
+def _static_div(left: Any, right: Any) -> Any:
+    return left / right if right != 0 else None
+
+
+def _static_and(left: Any, right: Any) -> Any:
+    return left and right
+
+
+def _static_or(left: Any, right: Any) -> Any:
+    return left or right
+
+
+_STATIC_UNARY_OPS: dict[str, Callable[[Any], Any]] = {
+    "-": operator.neg,
+    "+": lambda value: value,
+    "not": operator.not_,
+}
+_STATIC_BINARY_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _static_div,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "and": _static_and,
+    "or": _static_or,
+}
+
+# Parameter value node types whose value is recorded for static evaluation.
+_STATIC_VALUE_TYPES = frozenset({Literal, UnaryOp, BinaryOp})
+
+# Non-Int index expressions accepted on a TimeSeries (t, t+1, ...).
+_TIMESTEP_INDEX_NODES = (Variable, BinaryOp)
+
+# Currency literal prefix -> currency code. Other prefixes default to USD.
+_CURRENCY_SYMBOL = {"$": "USD", "€": "EUR", "£": "GBP"}
+
+
+# Dimension._shape: the cases dimensions_compatible distinguishes.
+_DIM_EMPTY = 0  # dimensionless
+_DIM_TIME = 1  # only a "time" tag
+_DIM_RATE = 2  # has a "rate" tag
+_DIM_OTHER = 3
+
+# (target kind, source kind) pairs that types_compatible always accepts.
+# Pairs whose answer depends on type parameters (Count <- Int, Count <- Count,
+# Count <- Quotient, Array <- Array) are handled explicitly in the method.
+_COERCIBLE_KIND_PAIRS: frozenset[tuple[str, str]] = frozenset({
+    # Count is a semantic wrapper around Int
+    ("Int", "Count"),
+    # Product types (from a * b) are assignable to an explicitly typed target,
+    # e.g. var revenue: Currency<USD> = count * rate
+    ("Count", "Product"),
+    ("Currency", "Product"),
+    ("Rate", "Product"),
+    ("Fraction", "Product"),
+    ("Duration", "Product"),
+    # var customers: Count<Customer> = revenue / price (evaluates to Fraction)
+    ("Count", "Fraction"),
+    # Quotient types (from a / b) are assignable to an explicitly typed target,
+    # e.g. var churn_rate: Rate per Month = churned / total
+    # Semantic contracts: FractionFromRatio, RevenuePerUnit_to_Price,
+    # RateNormalization, QuotientNormalization
+    ("Fraction", "Quotient"),
+    ("Currency", "Quotient"),
+    ("Rate", "Quotient"),
+    ("Duration", "Quotient"),
+    ("Int", "Quotient"),
+    # Rate assigned to Currency (for simplified benchmarks), e.g.
+    # param price: Currency<USD> = $10/1mo
+    ("Currency", "Rate"),
+})
+
+
+@dataclass(slots=True)
 class Dimension:
     """Represents dimensional units for type checking.
 
@@ -39,14 +171,47 @@ class Dimension:
     - Duration: {time: 1}
     - Count<Customer>: {count: 'Customer'}
     - Fraction: {} (dimensionless)
+
+    The tags consulted by multiply/divide are mirrored into attributes at
+    construction, and dimensionless() hands out a shared instance, so `units`
+    must not be mutated afterwards.
     """
     units: dict[str, Any]  # e.g., {'currency': 'USD'}, {'rate': 'Month', 'time': -1}
+    _currency: Any = field(init=False, repr=False, compare=False)
+    _rate: Any = field(init=False, repr=False, compare=False)
+    _time: Any = field(init=False, repr=False, compare=False)
+    _count: Any = field(init=False, repr=False, compare=False)
+    _scoped: Any = field(init=False, repr=False, compare=False)
+    _shape: int = field(init=False, repr=False, compare=False)
+    _key: tuple = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        units = self.units
+        self._currency = units.get('currency')
+        self._rate = units.get('rate')
+        self._time = units.get('time')
+        self._count = units.get('count')
+        self._scoped = units.get('scoped')
+        if not units:
+            self._shape = _DIM_EMPTY
+        elif 'rate' in units:
+            self._shape = _DIM_RATE
+        elif len(units) == 1 and 'time' in units:
+            self._shape = _DIM_TIME
+        else:
+            self._shape = _DIM_OTHER
+        # Canonical (order-independent) form of units for equality and hashing
+        self._key = tuple(sorted(units.items())) if len(units) > 1 else tuple(units.items())
+        self._hash = hash(self._key)
 
     def __eq__(self, other):
-        return isinstance(other, Dimension) and self.units == other.units
+        if self is other:
+            return True
+        return isinstance(other, Dimension) and self._key == other._key
 
     def __hash__(self):
-        return hash(frozenset(self.units.items()))
+        return self._hash
 
     def __repr__(self):
         return f"Dim({self.units})"
@@ -54,96 +219,120 @@ class Dimension:
     @staticmethod
     def dimensionless():
         """Return dimensionless type (Fraction, Bool, etc.)."""
-        return Dimension({})
+        return _DIMENSIONLESS
 
     @staticmethod
     def currency(code: str):
         """Currency type: USD, EUR, etc."""
-        return Dimension({'currency': code})
+        return _interned_dimension('currency', code)
 
     @staticmethod
     def rate(time_unit: str):
         """Rate per time unit."""
-        return Dimension({'rate': time_unit})
+        return _interned_dimension('rate', time_unit)
 
     @staticmethod
     def duration(time_unit: str | None = None):
         """Duration (time interval)."""
-        return Dimension({'time': time_unit or 'generic'})
+        return _interned_dimension('time', time_unit or 'generic')
 
     @staticmethod
     def count(entity: str):
         """Count of entities."""
-        return Dimension({'count': entity})
+        return _interned_dimension('count', entity)
 
     @staticmethod
     def capacity(resource: str):
         """Capacity of resource."""
-        return Dimension({'capacity': resource})
+        return _interned_dimension('capacity', resource)
 
     def multiply(self, other: 'Dimension') -> 'Dimension':
         """Multiply dimensions: Currency * Count -> Currency, Rate * Duration -> Fraction."""
+        # Scaling by a dimensionless value is the most common product and
+        # every rule leaves the other operand's units unchanged
+        if other._shape == _DIM_EMPTY:
+            return self
+        if self._shape == _DIM_EMPTY:
+            return other
+        key = (self, other)
+        product = _DIMENSION_PRODUCTS.get(key)
+        if product is None:
+            if len(_DIMENSION_PRODUCTS) >= _MEMO_LIMIT:
+                _DIMENSION_PRODUCTS.clear()
+            product = _DIMENSION_PRODUCTS[key] = self._multiply(other)
+        return product
+
+    def _multiply(self, other: 'Dimension') -> 'Dimension':
         # Special rules for economic types
 
         # Currency * scalar = Currency
-        if 'currency' in self.units and not other.units:
+        if self._currency is not None and not other.units:
             return self
-        if 'currency' in other.units and not self.units:
+        if other._currency is not None and not self.units:
             return other
 
         # Currency / Currency = scalar
-        if 'currency' in self.units and 'currency' in other.units:
-            if self.units['currency'] == other.units['currency']:
+        if self._currency is not None and other._currency is not None:
+            if self._currency == other._currency:
                 return Dimension.dimensionless()
-            raise ValueError(f"Cannot divide {self.units['currency']} by {other.units['currency']}")
+            raise ValueError(f"Cannot divide {self._currency} by {other._currency}")
 
         # Rate * Duration = scalar (if time units match)
-        if 'rate' in self.units and 'time' in other.units:
-            if self.units['rate'] == other.units['time'] or other.units['time'] == 'generic':
+        if self._rate is not None and other._time is not None:
+            if self._rate == other._time or other._time == 'generic':
                 return Dimension.dimensionless()
 
         # Count * scoped type = aggregated type
         # e.g., Count<Customer> * Currency<USD> per Customer = Currency<USD>
-        if 'count' in self.units and 'scoped' in other.units:
-            if self.units['count'] == other.units['scoped']:
+        if self._count is not None and other._scoped is not None:
+            if self._count == other._scoped:
                 # Remove scoped dimension
                 new_units = {k: v for k, v in other.units.items() if k != 'scoped'}
                 return Dimension(new_units)
 
-        # Generic multiplication: combine units
+        # Generic multiplication: combine units. On a shared tag the left
+        # operand's value is kept (exponents are not tracked yet).
         combined = dict(self.units)
         for key, value in other.units.items():
-            if key in combined:
-                # Same dimension: add exponents (for future support)
-                if combined[key] == value:
-                    combined[key] = value  # Keep as-is for now
-            else:
-                combined[key] = value
+            combined.setdefault(key, value)
 
         return Dimension(combined)
 
     def divide(self, other: 'Dimension') -> 'Dimension':
         """Divide dimensions."""
-        # Currency / Currency = scalar
-        if 'currency' in self.units and 'currency' in other.units:
-            if self.units['currency'] == other.units['currency']:
-                return Dimension.dimensionless()
-            raise ValueError(f"Cannot divide {self.units['currency']} by {other.units['currency']}")
-
-        # Currency / Duration = Currency per time
-        if 'currency' in self.units and 'time' in other.units:
-            return Dimension({'currency': self.units['currency'], 'per_time': other.units['time']})
-
-        # Currency / Rate = Currency (e.g., $/churn_rate -> LTV)
-        if 'currency' in self.units and 'rate' in other.units:
-            return Dimension.currency(self.units['currency'])
-
-        # Currency / Count = Currency per entity (scoped)
-        if 'currency' in self.units and 'count' in other.units:
-            return Dimension({'currency': self.units['currency'], 'scoped': other.units['count']})
+        if other._shape == _DIM_EMPTY:
+            return self
+        key = (self, other)
+        quotient = _DIMENSION_QUOTIENTS.get(key)
+        if quotient is None:
+            if len(_DIMENSION_QUOTIENTS) >= _MEMO_LIMIT:
+                _DIMENSION_QUOTIENTS.clear()
+            quotient = _DIMENSION_QUOTIENTS[key] = self._divide(other)
+        return quotient
+
+    def _divide(self, other: 'Dimension') -> 'Dimension':
+        currency = self._currency
+        if currency is not None:
+            # Currency / Currency = scalar
+            if other._currency is not None:
+                if currency == other._currency:
+                    return Dimension.dimensionless()
+                raise ValueError(f"Cannot divide {currency} by {other._currency}")
+
+            # Currency / Duration = Currency per time
+            if other._time is not None:
+                return Dimension({'currency': currency, 'per_time': other._time})
+
+            # Currency / Rate = Currency (e.g., $/churn_rate -> LTV)
+            if other._rate is not None:
+                return Dimension.currency(currency)
+
+            # Currency / Count = Currency per entity (scoped)
+            if other._count is not None:
+                return Dimension({'currency': currency, 'scoped': other._count})
 
         # Duration / Duration = scalar
-        if 'time' in self.units and 'time' in other.units:
+        if self._time is not None and other._time is not None:
             return Dimension.dimensionless()
 
         # Generic division
@@ -160,58 +349,124 @@ class Dimension:
         return Dimension(inverted)
 
 
-@dataclass
+_DIMENSIONLESS = Dimension({})
+# Results of Dimension.multiply/divide by operand pair. Models combine a small
+# set of dimensions over and over, so each distinct pair is worked out once.
+# Mismatches raise and are never stored. A long-lived process checking many
+# models starts over once a table reaches _MEMO_LIMIT entries.
+_MEMO_LIMIT = 4096
+_DIMENSION_PRODUCTS: dict[tuple[Dimension, Dimension], Dimension] = {}
+_DIMENSION_QUOTIENTS: dict[tuple[Dimension, Dimension], Dimension] = {}
+# Single-tag dimensions handed out by the Dimension factories, keyed by
+# (tag, value). Values come from source text, so the table is capped too.
+_SINGLE_TAG_DIMENSIONS: dict[tuple[str, Any], Dimension] = {}
+
+
+def _interned_dimension(tag: str, value: Any) -> Dimension:
+    key = (tag, value)
+    dim = _SINGLE_TAG_DIMENSIONS.get(key)
+    if dim is None:
+        if len(_SINGLE_TAG_DIMENSIONS) >= _MEMO_LIMIT:
+            _SINGLE_TAG_DIMENSIONS.clear()
+        dim = _SINGLE_TAG_DIMENSIONS[key] = Dimension({tag: value})
+    return dim
+
+
+@dataclass(frozen=True, slots=True)
 class PELType:
-    """Complete PEL type representation."""
+    """Complete PEL type representation.
+
+    Instances are immutable so the factory methods can hand out shared
+    instances for the most common types instead of allocating new ones.
+    """
     type_kind: str  # "Currency", "Rate", "Duration", "TimeSeries", etc.
     params: dict[str, Any]  # Type parameters
     dimension: Dimension  # Dimensional units
+    _text: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __eq__(self, other):
+        # Shared instances make identity the common case; otherwise compare
+        # the cheap fields before the params dicts.
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.type_kind == other.type_kind
+                and self.dimension == other.dimension
+                and self.params == other.params)
+
+    def __hash__(self):
+        # Consistent with __eq__ (equal types share kind and dimension) and
+        # avoids hashing the params dict, so types can key the factory tables.
+        return hash((self.type_kind, self.dimension))
 
     def __repr__(self):
-        if self.params:
-            param_str = ", ".join(f"{k}={v}" for k, v in self.params.items())
-            return f"{self.type_kind}<{param_str}>"
-        return self.type_kind
+        # Formatted once per instance; shared instances are rendered often
+        # (error messages, contract lookups, reports).
+        text = self._text
+        if text is None:
+            if self.params:
+                param_str = ", ".join(f"{k}={v}" for k, v in self.params.items())
+                text = f"{self.type_kind}<{param_str}>"
+            else:
+                text = self.type_kind
+            object.__setattr__(self, "_text", text)
+        return text
 
     @staticmethod
     def currency(code: str) -> 'PELType':
         """Currency type."""
-        return PELType(
-            type_kind="Currency",
-            params={"currency_code": code},
-            dimension=Dimension.currency(code)
-        )
+        cached = _CURRENCY_TYPES.get(code)
+        if cached is None:
+            if len(_CURRENCY_TYPES) >= _MEMO_LIMIT:
+                _CURRENCY_TYPES.clear()
+            cached = _CURRENCY_TYPES[code] = PELType(
+                type_kind="Currency",
+                params={"currency_code": code},
+                dimension=Dimension.currency(code)
+            )
+        return cached
 
     @staticmethod
     def rate(time_unit: str) -> 'PELType':
         """Rate per time unit."""
-        return PELType(
-            type_kind="Rate",
-            params={"per": time_unit},
-            dimension=Dimension.rate(time_unit)
-        )
+        cached = _RATE_TYPES.get(time_unit)
+        if cached is None:
+            if len(_RATE_TYPES) >= _MEMO_LIMIT:
+                _RATE_TYPES.clear()
+            cached = _RATE_TYPES[time_unit] = PELType(
+                type_kind="Rate",
+                params={"per": time_unit},
+                dimension=Dimension.rate(time_unit)
+            )
+        return cached
 
     @staticmethod
     def duration(time_unit: str | None = None) -> 'PELType':
         """Duration type."""
-        return PELType(
-            type_kind="Duration",
-            params={"unit": time_unit} if time_unit else {},
-            dimension=Dimension.duration(time_unit)
-        )
+        cached = _DURATION_TYPES.get(time_unit)
+        if cached is None:
+            if len(_DURATION_TYPES) >= _MEMO_LIMIT:
+                _DURATION_TYPES.clear()
+            cached = _DURATION_TYPES[time_unit] = PELType(
+                type_kind="Duration",
+                params={"unit": time_unit} if time_unit else {},
+                dimension=Dimension.duration(time_unit)
+            )
+        return cached
 
     @staticmethod
     def fraction() -> 'PELType':
         """Dimensionless fraction."""
-        return PELType(
-            type_kind="Fraction",
-            params={},
-            dimension=Dimension.dimensionless()
-        )
+        return _FRACTION
 
     @staticmethod
     def count(entity: str | None = None, per: str | None = None) -> 'PELType':
         """Count of entities (optionally per time unit)."""
+        key = (entity, per)
+        cached = _COUNT_TYPES.get(key)
+        if cached is not None:
+            return cached
         params: dict[str, Any] = {}
         units: dict[str, Any] = {}
 
@@ -223,73 +478,224 @@ class PELType:
             params["per"] = per
             units["inv_time"] = per
 
-        return PELType(
+        if len(_COUNT_TYPES) >= _MEMO_LIMIT:
+            _COUNT_TYPES.clear()
+        cached = _COUNT_TYPES[key] = PELType(
             type_kind="Count",
             params=params,
             dimension=Dimension(units) if units else Dimension.dimensionless()
         )
+        return cached
 
     @staticmethod
     def capacity(resource: str | None = None) -> 'PELType':
         """Capacity type (or generic if no resource specified)."""
+        cached = _CAPACITY_TYPES.get(resource)
+        if cached is not None:
+            return cached
         if resource:
-            return PELType(
+            cached = PELType(
                 type_kind="Capacity",
                 params={"resource": resource},
                 dimension=Dimension.capacity(resource)
             )
         else:
-            return PELType(
+            cached = PELType(
                 type_kind="Capacity",
                 params={},
                 dimension=Dimension.dimensionless()
             )
+        if len(_CAPACITY_TYPES) >= _MEMO_LIMIT:
+            _CAPACITY_TYPES.clear()
+        _CAPACITY_TYPES[resource] = cached
+        return cached
 
     @staticmethod
     def boolean() -> 'PELType':
         """Boolean type."""
-        return PELType(
-            type_kind="Boolean",
-            params={},
-            dimension=Dimension.dimensionless()
-        )
+        return _BOOLEAN
+
+    @staticmethod
+    def integer() -> 'PELType':
+        """Dimensionless integer."""
+        return _INT
 
     @staticmethod
     def timeseries(inner: 'PELType') -> 'PELType':
         """TimeSeries<T> type."""
-        return PELType(
-            type_kind="TimeSeries",
-            params={"inner": inner},
-            dimension=inner.dimension
-        )
+        key = ("TimeSeries", inner)
+        cached = _WRAPPER_TYPES.get(key)
+        if cached is None:
+            if len(_WRAPPER_TYPES) >= _MEMO_LIMIT:
+                _WRAPPER_TYPES.clear()
+            cached = _WRAPPER_TYPES[key] = PELType(
+                type_kind="TimeSeries",
+                params={"inner": inner},
+                dimension=inner.dimension
+            )
+        return cached
 
     @staticmethod
     def distribution(inner: 'PELType') -> 'PELType':
         """Distribution<T> type."""
-        return PELType(
-            type_kind="Distribution",
-            params={"inner": inner},
-            dimension=inner.dimension
-        )
+        key = ("Distribution", inner)
+        cached = _WRAPPER_TYPES.get(key)
+        if cached is None:
+            if len(_WRAPPER_TYPES) >= _MEMO_LIMIT:
+                _WRAPPER_TYPES.clear()
+            cached = _WRAPPER_TYPES[key] = PELType(
+                type_kind="Distribution",
+                params={"inner": inner},
+                dimension=inner.dimension
+            )
+        return cached
+
+    @staticmethod
+    def product(dimension: Dimension) -> 'PELType':
+        """Result of multiplying dimensions with no named type."""
+        return _derived_type("Product", dimension)
+
+    @staticmethod
+    def quotient(dimension: Dimension) -> 'PELType':
+        """Result of dividing dimensions with no named type."""
+        return _derived_type("Quotient", dimension)
+
+    @staticmethod
+    def array(element_type: 'PELType') -> 'PELType':
+        """Array<T> type."""
+        key = ("Array", element_type)
+        cached = _WRAPPER_TYPES.get(key)
+        if cached is None:
+            if len(_WRAPPER_TYPES) >= _MEMO_LIMIT:
+                _WRAPPER_TYPES.clear()
+            cached = _WRAPPER_TYPES[key] = PELType(
+                type_kind="Array",
+                params={"element_type": element_type},
+                dimension=Dimension.dimensionless()
+            )
+        return cached
+
+
+# Shared instances for the types the checker produces most often (every
+# literal, comparison result and fallback). Filled in after the class body
+# because the factories above consult these tables.
+_FRACTION = PELType(type_kind="Fraction", params={}, dimension=Dimension.dimensionless())
+_BOOLEAN = PELType(type_kind="Boolean", params={}, dimension=Dimension.dimensionless())
+_INT = PELType(type_kind="Int", params={}, dimension=Dimension.dimensionless())
+_STRING = PELType(type_kind="String", params={}, dimension=Dimension.dimensionless())
+# Types of numeric literals, for infer_array_literal's all-literal fast path
+_NUMERIC_LITERAL_TYPES: dict[str | None, PELType] = {"integer": _INT, "number": _FRACTION}
+# Literal kinds whose type does not depend on the literal's text
+_FIXED_LITERAL_TYPES: dict[str | None, PELType] = {
+    "integer": _INT,
+    "number": _FRACTION,
+    "percentage": _FRACTION,
+    "string": _STRING,
+}
+# Parameterised types are interned on first use; keys are the factory
+# arguments. Like the dimension tables, each is capped at _MEMO_LIMIT entries.
+_CURRENCY_TYPES: dict[str, PELType] = {}
+_RATE_TYPES: dict[str, PELType] = {}
+_DURATION_TYPES: dict[str | None, PELType] = {}
+_COUNT_TYPES: dict[tuple[str | None, str | None], PELType] = {}
+_CAPACITY_TYPES: dict[str | None, PELType] = {}
+# TimeSeries/Distribution/Array types keyed by (kind, inner type). The keys
+# hold their inner types, so this table is capped at _MEMO_LIMIT as well.
+_WRAPPER_TYPES: dict[tuple[str, PELType], PELType] = {}
+# Product/Quotient types keyed by (kind, dimension); capped at _MEMO_LIMIT
+# entries like the dimension memos they are built from
+_DERIVED_TYPES: dict[tuple[str, Dimension], PELType] = {}
+# Shared types of the known parameterless annotations without a dedicated
+# builder; any other kind is built per annotation
+_PLAIN_TYPES: dict[str, PELType] = {"Int": _INT, "String": _STRING}
+# Interned factories for the annotation kinds that wrap an inner type
+_WRAPPER_FACTORIES = {
+    "TimeSeries": PELType.timeseries,
+    "Distribution": PELType.distribution,
+    "Array": PELType.array,
+}
+# Types of currency literals by leading symbol; unknown symbols mean USD
+_CURRENCY_LITERAL_TYPES = {symbol: PELType.currency(code) for symbol, code in _CURRENCY_SYMBOL.items()}
+
+
+def _derived_type(type_kind: str, dimension: Dimension) -> PELType:
+    key = (type_kind, dimension)
+    cached = _DERIVED_TYPES.get(key)
+    if cached is None:
+        if len(_DERIVED_TYPES) >= _MEMO_LIMIT:
+            _DERIVED_TYPES.clear()
+        cached = _DERIVED_TYPES[key] = PELType(type_kind=type_kind, params={}, dimension=dimension)
+    return cached
+
+
+# Per-variable sections of the semantic contract report.
+_JUSTIFIED_CONVERSION_TEMPLATE = (
+    "**Variable: `{variable}`**\n"
+    "  - Conversion: `{from_type}` → `{to_type}`\n"
+    "  - Compatible: {compatible}\n"
+    "  - Contracts:\n"
+    "{contracts}"
+    "\n"
+)
+_UNJUSTIFIED_CONVERSION_TEMPLATE = (
+    "**Variable: `{variable}`**\n"
+    "  - Conversion: `{from_type}` → `{to_type}`\n"
+    "  - Compatible: {compatible}\n"
+    "  - ⚠️  NO SEMANTIC CONTRACT FOUND\n"
+    "  - Recommendation: Verify this conversion is correct\n"
+    "\n"
+)
+
+
+# Declaration values with fewer binary/unary operator nodes than this are
+# inferred top-down directly (see TypeChecker._infer_bottom_up)
+_BOTTOM_UP_MIN_NODES = 64
+
+# Function signatures parsed from stdlib/*.pel, keyed by file path. Every
+# TypeChecker loads the stdlib, so each file is only lexed and parsed again
+# when its modification time or size changes.
+_STDLIB_SIGNATURES: dict[str, tuple[tuple[int, int], list[tuple[str, tuple[PELType, ...], PELType]]]] = {}
+
+# Sentinel for TypeEnvironment.lookup (a scope may bind a name to None)
+_UNBOUND = object()
+
+
+class _StopChecking(BaseException):
+    """Raised by TypeChecker._report to abandon a fail-fast check.
+
+    A BaseException, so the broad `except Exception` guards around individual
+    checks do not swallow it.
+    """
 
 
 class TypeEnvironment:
     """Type environment for variable bindings."""
 
+    __slots__ = ("parent", "bindings", "_scopes")
+
     def __init__(self, parent: Optional['TypeEnvironment'] = None):
         self.parent = parent
         self.bindings: dict[str, PELType] = {}
+        # Binding dicts from innermost to outermost scope, so lookups walk a
+        # flat tuple instead of recursing through parents.
+        self._scopes: tuple[dict[str, PELType], ...] = (
+            (self.bindings,) + parent._scopes if parent is not None else (self.bindings,)
+        )
 
     def bind(self, name: str, pel_type: PELType):
         """Add a variable binding."""
         self.bindings[name] = pel_type
 
+    def bind_many(self, bindings: dict[str, PELType]) -> None:
+        """Add several variable bindings at once."""
+        self.bindings.update(bindings)
+
     def lookup(self, name: str) -> PELType | None:
         """Look up variable type."""
-        if name in self.bindings:
-            return self.bindings[name]
-        if self.parent:
-            return self.parent.lookup(name)
+        for scope in self._scopes:
+            pel_type = scope.get(name, _UNBOUND)
+            if pel_type is not _UNBOUND:
+                return cast(PELType, pel_type)
         return None
 
     def child_scope(self) -> 'TypeEnvironment':
@@ -315,9 +721,68 @@ class TypeChecker:
     def __init__(self) -> None:
         self.env = TypeEnvironment()
         self.errors: list[CompilerError] = []
+        # Set by check(): _report stops the check at the first error
+        self._fail_fast = False
         self.warnings: list[str] = []
         self.static_values: dict[str, Any] = {}  # Store static parameter values for constraint checking
+        # Static evaluation results keyed by id(expr). The node is stored with
+        # its value so the id cannot be recycled while the entry is alive.
+        self._static_eval_cache: dict[int, tuple[Expression, Any]] = {}
+        self._static_programs: dict[
+            int, tuple[Expression, tuple[tuple[int, Any], ...], frozenset[str]]
+        ] = {}
+        # Inferred types keyed by id(expr), valid for one check_model run.
+        # Only error-free inferences are memoized, so diagnostics still fire
+        # every time an ill-typed expression is visited.
+        self._expr_type_cache: dict[int, tuple[Expression, PELType]] = {}
+        # Declared and value types of model vars from the last check_model,
+        # reused by generate_contract_report. The value type is None when the
+        # checker did not infer it (distribution values).
+        self._var_types: dict[str, tuple[VarDecl, PELType, PELType | None]] = {}
         self.functions: dict[str, tuple[list[PELType], PELType]] = {}
+        self._binop_handlers: dict[OpKind, Callable[[PELType, PELType, BinaryOp], PELType]] = {
+            OpKind.ADD: self._infer_additive,
+            OpKind.SUB: self._infer_additive,
+            OpKind.MUL: self._infer_multiplication,
+            OpKind.DIV: self._infer_division,
+            OpKind.POW: self._infer_power,
+            OpKind.EQ: self._infer_comparison,
+            OpKind.NE: self._infer_comparison,
+            OpKind.LT: self._infer_comparison,
+            OpKind.LE: self._infer_comparison,
+            OpKind.GT: self._infer_comparison,
+            OpKind.GE: self._infer_comparison,
+            OpKind.AND: self._infer_logical,
+            OpKind.OR: self._infer_logical,
+        }
+        # Type annotation builders by annotation type_kind; other kinds use the
+        # generic fallback in ast_type_to_pel_type.
+        self._type_builders: dict[str, Callable[[TypeAnnotation], PELType]] = {
+            "Currency": self._build_currency_type,
+            "Rate": self._build_rate_type,
+            "Duration": self._build_duration_type,
+            "Fraction": self._build_fraction_type,
+            "Count": self._build_count_type,
+            "Capacity": self._build_capacity_type,
+            "Boolean": self._build_boolean_type,
+            "TimeSeries": self._build_wrapper_type,
+            "Array": self._build_wrapper_type,
+            "Distribution": self._build_wrapper_type,
+        }
+        # Expression inference handlers indexed by the node's NODE_KIND.
+        fallback = self._infer_unsupported_expression
+        self._expr_handlers: list[Callable[[Any], PELType]] = [fallback] * len(ExprKind)
+        self._expr_handlers[ExprKind.LITERAL] = self.infer_literal
+        self._expr_handlers[ExprKind.VARIABLE] = self.infer_variable
+        self._expr_handlers[ExprKind.BINARY_OP] = self.infer_binary_op
+        self._expr_handlers[ExprKind.UNARY_OP] = self.infer_unary_op
+        self._expr_handlers[ExprKind.FUNCTION_CALL] = self.infer_function_call
+        self._expr_handlers[ExprKind.INDEXING] = self.infer_indexing
+        self._expr_handlers[ExprKind.ARRAY_LITERAL] = self.infer_array_literal
+        self._expr_handlers[ExprKind.IF_THEN_ELSE] = self.infer_if_then_else
+        self._expr_handlers[ExprKind.PER_DURATION] = self.infer_per_duration_expression
+        self._expr_handlers[ExprKind.DISTRIBUTION] = self.infer_distribution
+        self._expr_handlers[ExprKind.BLOCK] = self.infer_block_expr
 
         # Built-ins used by the language surface syntax.
         # `t` is the implicit time index in TimeSeries expressions.
@@ -332,52 +797,78 @@ class TypeChecker:
             # Non-fatal: continue without stdlib if loading fails
             pass
 
-    def check(self, model: Model) -> Model:
+    def check(self, model: Model, fail_fast: bool = True) -> Model:
         """Type-check a model and raise on the first error.
 
-        The compiler pipeline expects this method.
+        The compiler pipeline expects this method. Only the first error is
+        raised, so by default checking stops as soon as it is found and
+        self.errors then holds just that error; pass fail_fast=False to
+        collect every error in self.errors first.
         """
-        typed = self.check_model(model)
+        if not fail_fast or self.errors:
+            typed = self.check_model(model)
+        else:
+            env = self.env
+            self._fail_fast = True
+            try:
+                typed = self.check_model(model)
+            except _StopChecking:
+                pass
+            finally:
+                self._fail_fast = False
+                self.env = env
         if self.has_errors():
             raise self.errors[0]
         return typed
 
     def check_model(self, model: Model) -> Model:
         """Type check entire model."""
+        self._static_eval_cache = {}
+        self._static_programs = {}
+        self._expr_type_cache = {}
+        self._var_types = {}
+
+        # Declarations are bound in source order (a value may only refer to
+        # names declared before it), writing straight into the model scope.
+        bindings = self.env.bindings
+
         # Phase 1: Collect parameter and variable declarations into environment
         for param in model.params:
             param_type = self.ast_type_to_pel_type(param.type_annotation)
-            self.env.bind(param.name, param_type)
+            bindings[param.name] = param_type
 
             # Store static literal values for constraint checking
             # Accept Literal, UnaryOp (for negation), and simple binary operations
-            if isinstance(param.value, (Literal, UnaryOp, BinaryOp)):
+            if type(param.value) in _STATIC_VALUE_TYPES:
                 self.static_values[param.name] = param.value
 
             # Type check parameter value
             # Distributions in surface syntax are treated as generators of the declared type.
             if not isinstance(param.value, Distribution):
-                value_type = self.infer_expression(param.value)
-                if not self.types_compatible(param_type, value_type):
-                    self.errors.append(self.create_enhanced_type_error(param_type, value_type))
-
-        # Phase 1.5: Register model-defined function signatures for call checking
+                param_value_type = self._infer_bottom_up(param.value)
+                if not self.types_compatible(param_type, param_value_type):
+                    self._report(self.create_enhanced_type_error(param_type, param_value_type))
+
+        # Phase 1.5: Register model-defined function signatures for call checking.
+        # Each signature's annotations are converted once; the parameter
+        # types are reused to bind the parameters when the body is checked.
+        func_param_types: list[list[PELType]] = []
         for func in model.funcs:
-            param_types: list[PELType] = []
-            for _, ptype in func.parameters:
-                param_types.append(self.ast_type_to_pel_type(ptype))
+            param_types = [self.ast_type_to_pel_type(ptype) for _, ptype in func.parameters]
+            func_param_types.append(param_types)
             return_type = self.ast_type_to_pel_type(func.return_type)
             self.functions[func.name] = (param_types, return_type)
 
         # Phase 1.6: Type check function bodies against declared signatures
-        for func in model.funcs:
+        for func, param_types in zip(model.funcs, func_param_types, strict=True):
             _, declared_return_type = self.functions[func.name]
 
             parent_env = self.env
             self.env = parent_env.child_scope()
 
-            for param_name, ptype in func.parameters:
-                self.env.bind(param_name, self.ast_type_to_pel_type(ptype))
+            self.env.bind_many({
+                param_name: param_type for (param_name, _), param_type in zip(func.parameters, param_types, strict=True)
+            })
 
             def check_func_stmt(stmt: Statement, expected_return_type: PELType) -> None:
                 if isinstance(stmt, VarDecl):
@@ -390,7 +881,11 @@ class TypeChecker:
 
                     self.env.bind(stmt.name, var_type)
 
-                    if stmt.value is not None and not isinstance(stmt.value, Distribution):
+                    # An unannotated local takes its value's type, so there is
+                    # nothing to check (and re-inferring would repeat errors).
+                    if (stmt.type_annotation
+                            and stmt.value is not None
+                            and not isinstance(stmt.value, Distribution)):
                         # Empty array literal with a type annotation: coerce
                         # to the declared type without inferring (avoids E0103).
                         if (isinstance(stmt.value, ArrayLiteral)
@@ -400,13 +895,10 @@ class TypeChecker:
                         else:
                             value_type = self.infer_expression(stmt.value)
                             if not self.types_compatible(var_type, value_type):
-                                self.errors.append(self.create_enhanced_type_error(var_type, value_type))
+                                self._report(self.create_enhanced_type_error(var_type, value_type))
 
                 elif isinstance(stmt, Assignment):
-                    target_type = self.infer_expression(stmt.target)
-                    value_type = self.infer_expression(stmt.value)
-                    if not self.types_compatible(target_type, value_type):
-                        self.errors.append(self.create_enhanced_type_error(target_type, value_type))
+                    self._check_assignment(stmt)
 
                 elif isinstance(stmt, Return):
                     if stmt.value is None:
@@ -419,17 +911,17 @@ class TypeChecker:
                         return
                     value_type = self.infer_expression(stmt.value)
                     if not self.types_compatible(expected_return_type, value_type):
-                        self.errors.append(
+                        self._report(
                             TypeError(
                                 "E0105",
-                                f"Return type mismatch: expected {expected_return_type}, got {value_type}",
+                                lambda: f"Return type mismatch: expected {expected_return_type}, got {value_type}",
                             )
                         )
 
                 elif isinstance(stmt, IfStmt):
                     cond_type = self.infer_expression(stmt.condition)
                     if cond_type.type_kind != "Boolean":
-                        self.errors.append(self.create_enhanced_type_error(PELType.boolean(), cond_type))
+                        self._report(self.create_enhanced_type_error(PELType.boolean(), cond_type))
                     for nested in stmt.then_body or []:
                         check_func_stmt(nested, expected_return_type)
                     for nested in stmt.else_body or []:
@@ -450,93 +942,98 @@ class TypeChecker:
 
             self.env = parent_env
 
+        # Literal array declarations seen so far, by name (first one wins),
+        # for the compile-time index bounds check below
+        array_vars: dict[str, ArrayLiteral] = {}
+
         # Phase 2: Type check variables (with type inference if needed)
         for var in model.vars:
+            value_type: PELType | None
             if var.type_annotation:
                 var_type = self.ast_type_to_pel_type(var.type_annotation)
+                value_type = None
             else:
-                # Infer type from value
+                # Infer type from value; it is then trivially the value's type
                 if var.value is None:
                     var_type = PELType.fraction()
                 else:
-                    var_type = self.infer_expression(var.value)
+                    var_type = self._infer_bottom_up(var.value)
                 var.type_annotation = self.pel_type_to_ast_type(var_type)
+                value_type = var_type
 
-            self.env.bind(var.name, var_type)
+            bindings[var.name] = var_type
 
-            # Type check value
-            if var.value is not None:
-                if not isinstance(var.value, Distribution):
-                    value_type = self.infer_expression(var.value)
+            # Type check value; each value is inferred exactly once, and the
+            # bounds and compatibility checks below reuse its type
+            if value_type is None and var.value is not None and not isinstance(var.value, Distribution):
+                value_type = self._infer_bottom_up(var.value)
+            self._var_types[var.name] = (var, var_type, value_type)
 
+            if var.value is not None:
+                if value_type is not None and not isinstance(var.value, Distribution):
                     # Compile-time check: indexing into a previously-declared literal array
                     # Example: var nums = [1,2,3]; var x = nums[10]; -> Index out of bounds
                     if isinstance(var.value, Indexing) and isinstance(var.value.index, Literal) and var.value.index.literal_type == "integer":
                         base = var.value.expression
                         if isinstance(base, Variable):
-                            # find prior declaration for base
-                            for prev in model.vars:
-                                if prev.name == base.name and isinstance(prev.value, ArrayLiteral):
-                                    try:
-                                        idx_val = int(var.value.index.value)
-                                        if idx_val < 0 or idx_val >= len(prev.value.elements):
-                                            self.errors.append(TypeError("E0302", "Index out of bounds"))
-                                    except Exception:
-                                        pass
-                                    break
+                            # find the prior declaration for base
+                            array = array_vars.get(base.name)
+                            if array is not None:
+                                idx_val = _index_value(var.value.index)
+                                if idx_val is not None and not 0 <= idx_val < len(array.elements):
+                                    self._report(TypeError("E0302", "Index out of bounds"))
 
                     if not self.types_compatible(var_type, value_type):
-                        self.errors.append(self.create_enhanced_type_error(var_type, value_type))
+                        self._report(self.create_enhanced_type_error(var_type, value_type))
+
+                    if isinstance(var.value, ArrayLiteral):
+                        array_vars.setdefault(var.name, var.value)
 
-        # Phase 3: Type check constraints
+        # Phase 3: Type check constraints and evaluate static ones (constraints
+        # involving only parameters with literal values) in a single pass.
+        # Checking stays sequential: constraints share the inference and
+        # static-evaluation memos, and the work is pure Python under the GIL.
         for constraint in model.constraints:
-            condition_type = self.infer_expression(constraint.condition)
+            condition_type = self._infer_bottom_up(constraint.condition)
             if condition_type.type_kind != "Boolean":
-                self.errors.append(self.create_enhanced_type_error(PELType.boolean(), condition_type))
+                self._report(self.create_enhanced_type_error(PELType.boolean(), condition_type))
 
-        # Phase 3.1: Evaluate static constraints (constraints involving only parameters with literal values)
-        for constraint in model.constraints:
             try:
+                # Only constraints whose parameters all have static values can
+                # evaluate to anything but None; skip the rest up front.
+                if not self._static_free_vars(constraint.condition) <= self.static_values.keys():
+                    continue
                 # Try to evaluate the constraint condition statically
                 result = self._evaluate_static_expression(constraint.condition)
-                if result is not None and not result:
-                    # Constraint is violated
-                    severity = constraint.severity
-                    if severity == "fatal":
-                        # Record constraint error for fatal constraint violations
-                        # Note: We don't have filename in constraint object, so location is None
-                        self.errors.append(
-                            constraint_violation(
-                                constraint.name,
-                                getattr(constraint, 'message', 'Constraint violated'),
-                                None
-                            )
-                        )
             except (AttributeError, KeyError, ValueError, ZeroDivisionError):
                 # If evaluation fails (e.g., references non-static values, division by zero), skip static check
-                # Log the exception for debugging if needed
-                pass
+                continue
+
+            if result is not None and not result and constraint.severity == "fatal":
+                # Record constraint error for fatal constraint violations
+                # Note: We don't have filename in constraint object, so location is None
+                self._report(
+                    constraint_violation(
+                        constraint.name,
+                        getattr(constraint, 'message', 'Constraint violated'),
+                        None
+                    )
+                )
 
         # Phase 3.5: Type check top-level statements (assignments, etc.)
         for stmt in model.statements:
             # Assignment: ensure target and value types are compatible
             if isinstance(stmt, Assignment):
-                target_type = self.infer_expression(stmt.target)
-                value_type = self.infer_expression(stmt.value)
-                if not self.types_compatible(target_type, value_type):
-                    self.errors.append(self.create_enhanced_type_error(target_type, value_type))
+                self._check_assignment(stmt)
             # For/If statements at top-level: ensure their contained expressions are type-checked
             elif isinstance(stmt, IfStmt):
                 # Type-check condition and bodies
                 cond_type = self.infer_expression(stmt.condition)
                 if cond_type.type_kind != "Boolean":
-                    self.errors.append(self.create_enhanced_type_error(PELType.boolean(), cond_type))
-                for s in (stmt.then_body or []) + (stmt.else_body or []):
+                    self._report(self.create_enhanced_type_error(PELType.boolean(), cond_type))
+                for s in chain(stmt.then_body or (), stmt.else_body or ()):
                     if isinstance(s, Assignment):
-                        tt = self.infer_expression(s.target)
-                        vt = self.infer_expression(s.value)
-                        if not self.types_compatible(tt, vt):
-                            self.errors.append(self.create_enhanced_type_error(tt, vt))
+                        self._check_assignment(s)
             elif isinstance(stmt, ForStmt):
                 # Basic validation of loop bounds
                 _ = self.infer_expression(stmt.start)
@@ -548,14 +1045,11 @@ class TypeChecker:
 
                 for nested in stmt.body or []:
                     if isinstance(nested, Assignment):
-                        tt = self.infer_expression(nested.target)
-                        vt = self.infer_expression(nested.value)
-                        if not self.types_compatible(tt, vt):
-                            self.errors.append(self.create_enhanced_type_error(tt, vt))
+                        self._check_assignment(nested)
                     elif isinstance(nested, IfStmt):
                         cond_t = self.infer_expression(nested.condition)
                         if cond_t.type_kind != "Boolean":
-                            self.errors.append(self.create_enhanced_type_error(PELType.boolean(), cond_t))
+                            self._report(self.create_enhanced_type_error(PELType.boolean(), cond_t))
 
                 self.env = loop_parent_env
 
@@ -563,114 +1057,159 @@ class TypeChecker:
         for policy in model.policies:
             trigger_type = self.infer_expression(policy.trigger.condition)
             if trigger_type.type_kind != "Boolean":
-                self.errors.append(self.create_enhanced_type_error(PELType.boolean(), trigger_type))
+                self._report(self.create_enhanced_type_error(PELType.boolean(), trigger_type))
 
         return model
 
+    def _check_assignment(self, stmt: Assignment) -> None:
+        """Check that an assigned value fits the type of its target."""
+        target_type = self.infer_expression(stmt.target)
+        value_type = self.infer_expression(stmt.value)
+        if not self.types_compatible(target_type, value_type):
+            self._report(self.create_enhanced_type_error(target_type, value_type))
+
     def infer_expression(self, expr: Expression) -> PELType:
         """Infer type of expression (synthesis)."""
-        if isinstance(expr, BlockExpr):
-            return self.infer_block_expr(expr)
-
-        if isinstance(expr, Literal):
-            return self.infer_literal(expr)
-
-        elif isinstance(expr, Variable):
-            var_type = self.env.lookup(expr.name)
-            if not var_type:
-                self.errors.append(undefined_variable(expr.name))
-                return PELType.fraction()  # Fallback
-            return var_type
-
-        elif isinstance(expr, BinaryOp):
-            return self.infer_binary_op(expr)
-
-        elif isinstance(expr, UnaryOp):
-            return self.infer_unary_op(expr)
-
-        elif isinstance(expr, FunctionCall):
-            return self.infer_function_call(expr)
-
-        elif isinstance(expr, IfThenElse):
-            return self.infer_if_then_else(expr)
-
-        elif isinstance(expr, Distribution):
-            return self.infer_distribution(expr)
-
-        elif isinstance(expr, PerDurationExpression):
-            return self.infer_per_duration_expression(expr)
-
-        elif isinstance(expr, ArrayLiteral):
-            return self.infer_array_literal(expr)
-
-        elif isinstance(expr, Indexing):
-            return self.infer_indexing(expr)
+        cached = self._expr_type_cache.get(id(expr))
+        if cached is not None and cached[0] is expr:
+            return cached[1]
 
+        # Dispatch inline rather than through a helper: this runs once per
+        # node visit, so the extra call frame is measurable on large models.
+        try:
+            handler = self._expr_handlers[expr.NODE_KIND]
+        except AttributeError:
+            handler = self._infer_unsupported_expression
+
+        error_count = len(self.errors)
+        result = handler(expr)
+        if len(self.errors) == error_count:
+            self._expr_type_cache[id(expr)] = (expr, result)
+        return result
+
+    def _infer_bottom_up(self, expr: Expression) -> PELType:
+        """infer_expression for declaration values, safe on long operator chains.
+
+        Operator chains such as `a + b + ... + z` nest one level per operand,
+        so inferring them top-down recurses once per term and overflows the
+        interpreter stack on long chains. Large values are instead inferred
+        children-first from an explicit stack, so each recursive call finds
+        its operands already memoized. Only binary and unary operators are
+        unrolled; any other operand is inferred as a whole at its position.
+
+        Nodes with errors in their subtree are normally not memoized (so the
+        errors are reported again if the node is inferred again later). Here
+        they are held in the memo only until `expr` itself has been inferred,
+        which keeps the reported errors and their order the same as a
+        top-down inference.
+        """
+        # Count operators only until the threshold is reached; most values are
+        # small and go straight to infer_expression without building `order`.
+        operator_count = 0
+        stack: list[Any] = [expr]
+        while stack:
+            node = stack.pop()
+            kind = getattr(node, "NODE_KIND", None)
+            if kind == ExprKind.BINARY_OP:
+                stack.append(node.left)
+                stack.append(node.right)
+            elif kind == ExprKind.UNARY_OP:
+                stack.append(node.operand)
+            else:
+                continue
+            operator_count += 1
+            if operator_count >= _BOTTOM_UP_MIN_NODES:
+                break
         else:
-            # Fallback
-            return PELType.fraction()
+            return self.infer_expression(expr)
+
+        order: list[Any] = []
+        stack = [expr]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            kind = getattr(node, "NODE_KIND", None)
+            if kind == ExprKind.BINARY_OP:
+                stack.append(node.left)
+                stack.append(node.right)
+            elif kind == ExprKind.UNARY_OP:
+                stack.append(node.operand)
+
+        # Reversed pre-order visits every node after its operands, left
+        # operands first; the root comes last.
+        cache = self._expr_type_cache
+        errors = self.errors
+        tainted: set[int] = set()
+        held: list[int] = []
+        for node in reversed(order):
+            error_count = len(errors)
+            node_type = self.infer_expression(node)
+            kind = getattr(node, "NODE_KIND", None)
+            if kind == ExprKind.BINARY_OP:
+                operands: tuple[Any, ...] = (node.left, node.right)
+            elif kind == ExprKind.UNARY_OP:
+                operands = (node.operand,)
+            else:
+                operands = ()
+            if len(errors) != error_count or any(id(operand) in tainted for operand in operands):
+                tainted.add(id(node))
+                cache[id(node)] = (node, node_type)
+                held.append(id(node))
+
+        for key in held:
+            cache.pop(key, None)
+        return node_type
+
+    def _infer_unsupported_expression(self, expr: Any) -> PELType:
+        # Fallback
+        return PELType.fraction()
+
+    def infer_variable(self, expr: Variable) -> PELType:
+        """Infer type of a variable reference from the environment."""
+        var_type = self.env.lookup(expr.name)
+        if not var_type:
+            self._report(undefined_variable(expr.name))
+            return PELType.fraction()  # Fallback
+        return var_type
 
     def infer_block_expr(self, expr: BlockExpr) -> PELType:
         """Infer type of a block expression from its return statements."""
-
-        def find_returns(statements: list[Statement]) -> PELType | None:
-            for stmt in statements:
-                if isinstance(stmt, Return):
-                    return self.infer_expression(stmt.value) if stmt.value is not None else PELType.fraction()
-                if isinstance(stmt, IfStmt):
-                    then_t = find_returns(stmt.then_body)
-                    else_t = find_returns(stmt.else_body or [])
-                    return then_t or else_t
-                if isinstance(stmt, ForStmt):
-                    body_t = find_returns(stmt.body)
-                    if body_t is not None:
-                        return body_t
-            return None
-
-        return find_returns(expr.statements) or PELType.fraction()
+        return self._find_block_return_type(expr.statements) or PELType.fraction()
+
+    def _find_block_return_type(self, statements: Iterable[Statement]) -> PELType | None:
+        """Return the type of the first return statement reachable in `statements`."""
+        for stmt in statements:
+            if isinstance(stmt, Return):
+                return self.infer_expression(stmt.value) if stmt.value is not None else PELType.fraction()
+            if isinstance(stmt, IfStmt):
+                then_t = self._find_block_return_type(stmt.then_body)
+                if then_t is not None:
+                    return then_t
+                return self._find_block_return_type(stmt.else_body or ())
+            if isinstance(stmt, ForStmt):
+                body_t = self._find_block_return_type(stmt.body)
+                if body_t is not None:
+                    return body_t
+        return None
 
     def infer_literal(self, lit: Literal) -> PELType:
         """Infer type from literal."""
-        # Integer literals should infer `Int` (conformance expects Int vs Float distinction)
-        if lit.literal_type == "integer":
-            return PELType(type_kind="Int", params={}, dimension=Dimension.dimensionless())
+        literal_type = lit.literal_type
 
-        if lit.literal_type == "number":
-            return PELType.fraction()  # Plain (float) number is dimensionless
+        # Integer literals should infer `Int` (conformance expects Int vs Float
+        # distinction); plain numbers, percentages and strings have fixed types.
+        fixed = _FIXED_LITERAL_TYPES.get(literal_type)
+        if fixed is not None:
+            return fixed
 
-        elif lit.literal_type == "currency":
+        if literal_type == "currency":
             # Parse currency code from literal (e.g., "$100" -> USD)
-            if lit.value.startswith('$'):
-                return PELType.currency("USD")
-            elif lit.value.startswith('€'):
-                return PELType.currency("EUR")
-            elif lit.value.startswith('£'):
-                return PELType.currency("GBP")
-            else:
-                return PELType.currency("USD")  # Default
-
-        elif lit.literal_type == "percentage":
-            return PELType.fraction()
+            return _CURRENCY_LITERAL_TYPES.get(lit.value[:1]) or PELType.currency("USD")
 
-        elif lit.literal_type == "duration":
-            # Parse duration (e.g., "30d", "18mo", "2w", "1q", "1yr")
-            text = str(lit.value)
-            match = re.match(r"^(\d+)(d|w|mo|q|yr)$", text)
-            if not match:
-                return PELType.duration()
-
-            unit = match.group(2)
-            unit_map = {
-                "d": "Day",
-                "w": "Week",
-                "mo": "Month",
-                "q": "Quarter",
-                "yr": "Year",
-            }
-            return PELType.duration(unit_map[unit])
-
-        elif lit.literal_type == "string":
-            return PELType(type_kind="String", params={}, dimension=Dimension.dimensionless())
+        elif literal_type == "duration":
+            # Parse duration (e.g., "30d", "18mo", "2w", "1q", "1yr"); text
+            # that is not a valid duration gives a generic Duration
+            return PELType.duration(_duration_unit(str(lit.value)))
 
         else:
             return PELType.fraction()
@@ -680,142 +1219,144 @@ class TypeChecker:
         left_type = self.infer_expression(expr.left)
         right_type = self.infer_expression(expr.right)
 
-        operator = expr.operator
+        handler = self._binop_handlers.get(expr.operator_kind)
+        if handler is None:
+            # Unknown operator
+            return PELType.fraction()
+        return handler(left_type, right_type, expr)
 
-        # Addition and subtraction: types must match
-        if operator in ['+', '-']:
-            if not self.dimensions_compatible(left_type.dimension, right_type.dimension):
-                self.errors.append(dimensional_mismatch(operator, str(left_type), str(right_type)))
-                return left_type  # Fallback
-
-            return left_type  # Result has same type
-
-        # Multiplication: dimensional multiplication
-        elif operator == '*':
-            # ORDERING DEPENDENCY: Duration shortcut MUST precede dimensionless shortcut
-            # to avoid fragile interaction when both conditions match (e.g., Fraction × Duration)
-
-            # Duration × scalar = Duration (commutativity handled by both branches)
-            if left_type.type_kind == "Duration" and not right_type.dimension.units:
-                return left_type
-            if right_type.type_kind == "Duration" and not left_type.dimension.units:
-                return right_type
-
-            # Dimensionless scalar × dimensioned type = dimensioned type (preserves kind)
-            # This enables clean PEL code like: efficiency * capacity, count * rate
-            # Examples:
-            #   Fraction × Rate per Month → Rate per Month
-            #   Int × Currency<USD> → Currency<USD>
-            #   Count<Person> × Rate per Month → Rate per Month
-            if left_type.type_kind in self.DIMENSIONLESS_KINDS and right_type.type_kind not in self.DIMENSIONLESS_KINDS:
-                return right_type
-            if right_type.type_kind in self.DIMENSIONLESS_KINDS and left_type.type_kind not in self.DIMENSIONLESS_KINDS:
-                return left_type
-
-            # Generic dimensional multiplication: compute result dimension
-            result_dim = left_type.dimension.multiply(right_type.dimension)
-
-            # Determine result type kind
-            if 'currency' in result_dim.units:
-                return PELType.currency(result_dim.units['currency'])
-            elif not result_dim.units:
-                return PELType.fraction()
-            else:
-                # Generic result
-                return PELType(type_kind="Product", params={}, dimension=result_dim)
-
-        # Division: dimensional division
-        elif operator == '/':
-            # Static check: division by literal zero should be reported as an error
-            if isinstance(expr.right, Literal) and expr.right.literal_type in ("number", "integer"):
-                try:
-                    if float(expr.right.value) == 0.0:
-                        self.errors.append(TypeError("E0105", "Division by zero"))
-                        return left_type
-                except Exception:
-                    pass
+    def _infer_additive(self, left_type: PELType, right_type: PELType, expr: BinaryOp) -> PELType:
+        """Addition and subtraction: types must match."""
+        if not self.dimensions_compatible(left_type.dimension, right_type.dimension):
+            self._report(dimensional_mismatch(expr.operator, left_type, right_type))
+            return left_type  # Fallback
 
-            # Dimensionless per Duration => Rate per time unit (e.g., 0.30/1mo)
-            if not left_type.dimension.units and right_type.type_kind == "Duration":
-                time_unit = right_type.dimension.units.get("time", "generic")
-                return PELType.rate(time_unit)
+        return left_type  # Result has same type
 
-            result_dim = left_type.dimension.divide(right_type.dimension)
+    def _infer_multiplication(self, left_type: PELType, right_type: PELType, expr: BinaryOp) -> PELType:
+        """Multiplication: dimensional multiplication."""
+        # ORDERING DEPENDENCY: Duration shortcut MUST precede dimensionless shortcut
+        # to avoid fragile interaction when both conditions match (e.g., Fraction × Duration)
 
-            # Determine result type kind
-            if not result_dim.units:
-                return PELType.fraction()
-            elif 'currency' in result_dim.units and len(result_dim.units) == 1:
-                return PELType.currency(result_dim.units['currency'])
-            elif 'currency' in result_dim.units and 'per_time' in result_dim.units:
-                # Current type system does not model Currency-per-time as a distinct
-                # first-class type in annotations; keep currency compatibility.
-                return PELType.currency(result_dim.units['currency'])
-            else:
-                # Generic result
-                return PELType(type_kind="Quotient", params={}, dimension=result_dim)
+        # Duration × scalar = Duration (commutativity handled by both branches)
+        if left_type.type_kind == "Duration" and not right_type.dimension.units:
+            return left_type
+        if right_type.type_kind == "Duration" and not left_type.dimension.units:
+            return right_type
+
+        # Dimensionless scalar × dimensioned type = dimensioned type (preserves kind)
+        # This enables clean PEL code like: efficiency * capacity, count * rate
+        # Examples:
+        #   Fraction × Rate per Month → Rate per Month
+        #   Int × Currency<USD> → Currency<USD>
+        #   Count<Person> × Rate per Month → Rate per Month
+        if left_type.type_kind in self.DIMENSIONLESS_KINDS and right_type.type_kind not in self.DIMENSIONLESS_KINDS:
+            return right_type
+        if right_type.type_kind in self.DIMENSIONLESS_KINDS and left_type.type_kind not in self.DIMENSIONLESS_KINDS:
+            return left_type
 
-        # Exponentiation: exponent must be dimensionless
-        elif operator == '^':
-            if right_type.dimension.units:
-                self.errors.append(
-                    TypeError(
-                        "E0100",
-                        f"Exponent must be dimensionless, got {right_type}",
-                    )
-                )
+        # Generic dimensional multiplication: compute result dimension
+        result_dim = left_type.dimension.multiply(right_type.dimension)
 
-            # Result has same dimension as base (for integer exponents)
-            return left_type
+        # Determine result type kind
+        if 'currency' in result_dim.units:
+            return PELType.currency(result_dim.units['currency'])
+        elif not result_dim.units:
+            return PELType.fraction()
+        else:
+            # Generic result
+            return PELType.product(result_dim)
 
-        # Comparison operators: operands must be compatible, result is Boolean
-        elif operator in ['==', '!=', '<', '>', '<=', '>=']:
-            # Allow comparing Quotient/Product types with dimensionless types (Int, Fraction)
-            # This handles: (count1 / count2) >= 15
-            if (left_type.type_kind in ["Quotient", "Product"] and right_type.type_kind in ["Int", "Fraction"]) or \
-               (right_type.type_kind in ["Quotient", "Product"] and left_type.type_kind in ["Int", "Fraction"]):
-                pass  # Allow comparison
-            # Allow comparisons between Count and Int thresholds (e.g., users >= 100)
-            elif (left_type.type_kind == "Count" and right_type.type_kind == "Int") or \
-                 (right_type.type_kind == "Count" and left_type.type_kind == "Int"):
+    def _infer_division(self, left_type: PELType, right_type: PELType, expr: BinaryOp) -> PELType:
+        """Division: dimensional division."""
+        # Static check: division by literal zero should be reported as an error
+        if isinstance(expr.right, Literal) and expr.right.literal_type in ("number", "integer"):
+            try:
+                if float(expr.right.value) == 0.0:
+                    self._report(TypeError("E0105", "Division by zero"))
+                    return left_type
+            except Exception:
                 pass
-            # Backward-compatibility for thresholds like `burn < $0/1mo`.
-            # Keep strict mismatch checks for non-zero Currency-vs-Rate comparisons.
-            elif left_type.type_kind == "Currency" and right_type.type_kind == "Rate":
-                if isinstance(expr.right, PerDurationExpression) and isinstance(expr.right.left, Literal) and expr.right.left.literal_type == "currency":
-                    currency_text = str(expr.right.left.value).replace("_", "")
-                    if re.match(r"^[^\d-]*0+(?:\.0+)?$", currency_text):
-                        pass
-                    else:
-                        self.errors.append(dimensional_mismatch(operator, str(left_type), str(right_type)))
+
+        # Dimensionless per Duration => Rate per time unit (e.g., 0.30/1mo)
+        if not left_type.dimension.units and right_type.type_kind == "Duration":
+            time_unit = right_type.dimension.units.get("time", "generic")
+            return PELType.rate(time_unit)
+
+        result_dim = left_type.dimension.divide(right_type.dimension)
+
+        # Determine result type kind
+        if not result_dim.units:
+            return PELType.fraction()
+        elif 'currency' in result_dim.units and len(result_dim.units) == 1:
+            return PELType.currency(result_dim.units['currency'])
+        elif 'currency' in result_dim.units and 'per_time' in result_dim.units:
+            # Current type system does not model Currency-per-time as a distinct
+            # first-class type in annotations; keep currency compatibility.
+            return PELType.currency(result_dim.units['currency'])
+        else:
+            # Generic result
+            return PELType.quotient(result_dim)
+
+    def _infer_power(self, left_type: PELType, right_type: PELType, expr: BinaryOp) -> PELType:
+        """Exponentiation: exponent must be dimensionless."""
+        if right_type.dimension.units:
+            self._report(
+                TypeError(
+                    "E0100",
+                    lambda: f"Exponent must be dimensionless, got {right_type}",
+                )
+            )
+
+        # Result has same dimension as base (for integer exponents)
+        return left_type
+
+    def _infer_comparison(self, left_type: PELType, right_type: PELType, expr: BinaryOp) -> PELType:
+        """Comparison operators: operands must be compatible, result is Boolean."""
+        operator = expr.operator
+
+        # Allow comparing Quotient/Product types with dimensionless types (Int, Fraction)
+        # This handles: (count1 / count2) >= 15
+        if (left_type.type_kind in ["Quotient", "Product"] and right_type.type_kind in ["Int", "Fraction"]) or \
+           (right_type.type_kind in ["Quotient", "Product"] and left_type.type_kind in ["Int", "Fraction"]):
+            pass  # Allow comparison
+        # Allow comparisons between Count and Int thresholds (e.g., users >= 100)
+        elif (left_type.type_kind == "Count" and right_type.type_kind == "Int") or \
+             (right_type.type_kind == "Count" and left_type.type_kind == "Int"):
+            pass
+        # Backward-compatibility for thresholds like `burn < $0/1mo`.
+        # Keep strict mismatch checks for non-zero Currency-vs-Rate comparisons.
+        elif left_type.type_kind == "Currency" and right_type.type_kind == "Rate":
+            if isinstance(expr.right, PerDurationExpression) and isinstance(expr.right.left, Literal) and expr.right.left.literal_type == "currency":
+                currency_text = str(expr.right.left.value).replace("_", "")
+                if re.match(r"^[^\d-]*0+(?:\.0+)?$", currency_text):
+                    pass
                 else:
-                    self.errors.append(dimensional_mismatch(operator, str(left_type), str(right_type)))
-            elif right_type.type_kind == "Currency" and left_type.type_kind == "Rate":
-                if isinstance(expr.left, PerDurationExpression) and isinstance(expr.left.left, Literal) and expr.left.left.literal_type == "currency":
-                    currency_text = str(expr.left.left.value).replace("_", "")
-                    if re.match(r"^[^\d-]*0+(?:\.0+)?$", currency_text):
-                        pass
-                    else:
-                        self.errors.append(dimensional_mismatch(operator, str(left_type), str(right_type)))
+                    self._report(dimensional_mismatch(operator, left_type, right_type))
+            else:
+                self._report(dimensional_mismatch(operator, left_type, right_type))
+        elif right_type.type_kind == "Currency" and left_type.type_kind == "Rate":
+            if isinstance(expr.left, PerDurationExpression) and isinstance(expr.left.left, Literal) and expr.left.left.literal_type == "currency":
+                currency_text = str(expr.left.left.value).replace("_", "")
+                if re.match(r"^[^\d-]*0+(?:\.0+)?$", currency_text):
+                    pass
                 else:
-                    self.errors.append(dimensional_mismatch(operator, str(left_type), str(right_type)))
-            elif not self.dimensions_compatible(left_type.dimension, right_type.dimension):
-                self.errors.append(dimensional_mismatch(operator, str(left_type), str(right_type)))
-
-            return PELType.boolean()
+                    self._report(dimensional_mismatch(operator, left_type, right_type))
+            else:
+                self._report(dimensional_mismatch(operator, left_type, right_type))
+        elif not self.dimensions_compatible(left_type.dimension, right_type.dimension):
+            self._report(dimensional_mismatch(operator, left_type, right_type))
 
-        # Logical operators: operands must be Boolean
-        elif operator in ['&&', '||']:
-            if left_type.type_kind != "Boolean":
-                self.errors.append(self.create_enhanced_type_error(PELType.boolean(), left_type))
-            if right_type.type_kind != "Boolean":
-                self.errors.append(self.create_enhanced_type_error(PELType.boolean(), right_type))
+        return PELType.boolean()
 
-            return PELType.boolean()
+    def _infer_logical(self, left_type: PELType, right_type: PELType, expr: BinaryOp) -> PELType:
+        """Logical operators: operands must be Boolean."""
+        if left_type.type_kind != "Boolean":
+            self._report(self.create_enhanced_type_error(PELType.boolean(), left_type))
+        if right_type.type_kind != "Boolean":
+            self._report(self.create_enhanced_type_error(PELType.boolean(), right_type))
 
-        else:
-            # Unknown operator
-            return PELType.fraction()
+        return PELType.boolean()
 
     def infer_unary_op(self, expr: UnaryOp) -> PELType:
         """Infer type of unary operation."""
@@ -828,7 +1369,7 @@ class TypeChecker:
         elif expr.operator == '!':
             # Logical NOT: operand must be Boolean
             if operand_type.type_kind != "Boolean":
-                self.errors.append(self.create_enhanced_type_error(PELType.boolean(), operand_type))
+                self._report(self.create_enhanced_type_error(PELType.boolean(), operand_type))
             return PELType.boolean()
 
         else:
@@ -839,7 +1380,7 @@ class TypeChecker:
         # Built-in functions
         if expr.function_name == 'sqrt':
             if len(expr.arguments) != 1:
-                self.errors.append(
+                self._report(
                     TypeError(
                         "E0100",
                         f"sqrt expects 1 argument, got {len(expr.arguments)}",
@@ -851,7 +1392,7 @@ class TypeChecker:
 
         elif expr.function_name == 'sum':
             if len(expr.arguments) != 1:
-                self.errors.append(
+                self._report(
                     TypeError(
                         "E0100",
                         f"sum expects 1 argument, got {len(expr.arguments)}",
@@ -866,7 +1407,7 @@ class TypeChecker:
         elif expr.function_name == 'len':
             # len(array) → Int (number of elements)
             if len(expr.arguments) != 1:
-                self.errors.append(
+                self._report(
                     TypeError("E0100", f"len expects 1 argument, got {len(expr.arguments)}"),
                 )
             else:
@@ -876,7 +1417,7 @@ class TypeChecker:
         elif expr.function_name == 'max':
             # max(a, b) → type of first argument   OR   max(array) → element type
             if len(expr.arguments) == 0:
-                self.errors.append(TypeError("E0100", "max expects at least 1 argument"))
+                self._report(TypeError("E0100", "max expects at least 1 argument"))
                 return PELType.fraction()
             arg_type = self.infer_expression(expr.arguments[0])
             if len(expr.arguments) == 1 and arg_type.type_kind == "Array":
@@ -888,7 +1429,7 @@ class TypeChecker:
         elif expr.function_name == 'min':
             # min(a, b) → type of first argument   OR   min(array) → element type
             if len(expr.arguments) == 0:
-                self.errors.append(TypeError("E0100", "min expects at least 1 argument"))
+                self._report(TypeError("E0100", "min expects at least 1 argument"))
                 return PELType.fraction()
             arg_type = self.infer_expression(expr.arguments[0])
             if len(expr.arguments) == 1 and arg_type.type_kind == "Array":
@@ -900,7 +1441,7 @@ class TypeChecker:
         elif expr.function_name == 'abs':
             # abs(x) → same type as x
             if len(expr.arguments) != 1:
-                self.errors.append(
+                self._report(
                     TypeError("E0100", f"abs expects 1 argument, got {len(expr.arguments)}"),
                 )
             arg_type = self.infer_expression(expr.arguments[0])
@@ -909,7 +1450,7 @@ class TypeChecker:
         elif expr.function_name == 'pow':
             # pow(base, exponent) → type of base
             if len(expr.arguments) != 2:
-                self.errors.append(
+                self._report(
                     TypeError("E0100", f"pow expects 2 arguments, got {len(expr.arguments)}"),
                 )
                 if expr.arguments:
@@ -922,7 +1463,7 @@ class TypeChecker:
         elif expr.function_name == 'round':
             # round(x) → same type as x (rounds to nearest integer)
             if len(expr.arguments) == 0:
-                self.errors.append(TypeError("E0100", "round expects 1 argument"))
+                self._report(TypeError("E0100", "round expects 1 argument"))
                 return PELType.fraction()
             arg_type = self.infer_expression(expr.arguments[0])
             for arg in expr.arguments[1:]:
@@ -936,7 +1477,7 @@ class TypeChecker:
                 param_types, return_type = sig
                 # Basic arity check
                 if len(param_types) != len(expr.arguments):
-                    self.errors.append(
+                    self._report(
                         TypeError(
                             "E0100",
                             (
@@ -950,18 +1491,17 @@ class TypeChecker:
                     if i < len(param_types):
                         arg_type = self.infer_expression(arg)
                         if not self.types_compatible(param_types[i], arg_type):
-                            self.errors.append(
+                            self._report(
                                 TypeError(
                                     "E0101",
-                                    (
-                                        f"Type mismatch in function '{expr.function_name}' argument {i + 1}: "
-                                        f"expected {param_types[i]}, got {arg_type}"
+                                    partial(
+                                        _argument_mismatch_message, expr.function_name, i + 1, param_types[i], arg_type
                                     ),
                                 )
                             )
                 return return_type
 
-            self.errors.append(
+            self._report(
                 TypeError("E0104", f"Undefined function '{expr.function_name}'")
             )
             return PELType.fraction()
@@ -980,26 +1520,32 @@ class TypeChecker:
 
         for pel_file in stdlib_dir.rglob('*.pel'):
             try:
-                src = pel_file.read_text(encoding='utf-8')
-                # Wrap in a model so Parser can parse function declarations
-                wrapped = f"model __stdlib_wrapper__ {{\n{src}\n}}\n"
-                lexer = Lexer(wrapped, filename=str(pel_file))
-                tokens = lexer.tokenize()
-                parser = Parser(tokens)
-                model = parser.parse()
-
-                for func in model.funcs:
-                    # func.parameters: list of (name, TypeAnnotation)
-                    param_types: list[PELType] = []
-                    for _, ptype in func.parameters:
-                        pel_t = self.ast_type_to_pel_type(ptype)
-                        param_types.append(pel_t)
-
-                    return_pel_type = self.ast_type_to_pel_type(func.return_type)
-                    self.functions[func.name] = (param_types, return_pel_type)
+                stat = pel_file.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                cached = _STDLIB_SIGNATURES.get(str(pel_file))
+                if cached is not None and cached[0] == stamp:
+                    signatures = cached[1]
+                else:
+                    src = pel_file.read_text(encoding='utf-8')
+                    # Wrap in a model so Parser can parse function declarations
+                    wrapped = f"model __stdlib_wrapper__ {{\n{src}\n}}\n"
+                    lexer = Lexer(wrapped, filename=str(pel_file))
+                    tokens = lexer.tokenize()
+                    parser = Parser(tokens)
+                    model = parser.parse()
+
+                    signatures = []
+                    for func in model.funcs:
+                        # func.parameters: list of (name, TypeAnnotation)
+                        param_types = tuple(self.ast_type_to_pel_type(ptype) for _, ptype in func.parameters)
+                        return_pel_type = self.ast_type_to_pel_type(func.return_type)
+                        signatures.append((func.name, param_types, return_pel_type))
+                    _STDLIB_SIGNATURES[str(pel_file)] = (stamp, signatures)
+
+                for name, param_types, return_pel_type in signatures:
+                    self.functions[name] = (list(param_types), return_pel_type)
             except Exception as e:
                 # Log parse errors for debugging but don't fail initialization
-                import sys
                 print(f"Warning: Failed to load stdlib from {pel_file.name}: {e}", file=sys.stderr)
                 continue
 
@@ -1007,13 +1553,13 @@ class TypeChecker:
         """Infer type of if-then-else expression."""
         condition_type = self.infer_expression(expr.condition)
         if condition_type.type_kind != "Boolean":
-            self.errors.append(self.create_enhanced_type_error(PELType.boolean(), condition_type))
+            self._report(self.create_enhanced_type_error(PELType.boolean(), condition_type))
 
         then_type = self.infer_expression(expr.then_expr)
         else_type = self.infer_expression(expr.else_expr)
 
         if not self.types_compatible(then_type, else_type):
-            self.errors.append(self.create_enhanced_type_error(then_type, else_type))
+            self._report(self.create_enhanced_type_error(then_type, else_type))
 
         return then_type
 
@@ -1021,44 +1567,35 @@ class TypeChecker:
         """Infer type of distribution expression."""
         # In PEL surface syntax, distributions act as values of their inner type.
         # Example: param x: Rate per Month = ~Normal(mu=..., sigma=...)
-        resolved_params = {}
-        for param_name, param_value in expr.params.items():
-            resolved_params[param_name] = self.infer_expression(param_value)
-
-        # Validate distribution parameter types (conformance: parameters must be numeric)
-        for _param_name, ptype in resolved_params.items():
+        # One pass over the parameters; the first one's type is the hint for
+        # the distribution's type, and the type mismatches are reported after
+        # all parameters have been inferred
+        inner_type = None
+        mismatches = 0
+        for param_value in expr.params.values():
+            ptype = self.infer_expression(param_value)
+            if inner_type is None:
+                inner_type = ptype
+            # Validate distribution parameter types (conformance: parameters must be numeric)
             if ptype.type_kind not in ("Int", "Fraction"):
-                self.errors.append(TypeError("E0104", "Distribution parameter type mismatch"))
+                mismatches += 1
 
-        # Assume the distribution's type matches its declared inner type
-        inner_type = PELType.fraction()  # Default to dimensionless
-        if resolved_params:
-            # Use the first resolved parameter's type as a hint (if applicable)
-            first_param_type = next(iter(resolved_params.values()), None)
-            if first_param_type:
-                inner_type = first_param_type
+        for _ in range(mismatches):
+            self._report(TypeError("E0104", "Distribution parameter type mismatch"))
 
+        if inner_type is None:
+            # No parameters: default to dimensionless
+            inner_type = PELType.fraction()
         return inner_type
 
     def infer_per_duration_expression(self, expr: PerDurationExpression) -> PELType:
         """Infer type of per-duration expression (e.g., $500/1mo -> Rate per Month)."""
         # Parse duration to extract time unit
-        duration_str = expr.duration
-        match = re.match(r"^(\d+)(d|w|mo|q|yr)$", duration_str)
-        if not match:
+        time_unit = _duration_unit(expr.duration)
+        if time_unit is None:
             # Invalid duration format, fallback to Fraction
             return PELType.fraction()
 
-        unit_abbrev = match.group(2)
-        unit_map = {
-            "d": "Day",
-            "w": "Week",
-            "mo": "Month",
-            "q": "Quarter",
-            "yr": "Year",
-        }
-        time_unit = unit_map.get(unit_abbrev, "Month")
-
         # Return Rate type with the appropriate time unit
         return PELType.rate(time_unit)
 
@@ -1069,24 +1606,41 @@ class TypeChecker:
             # Callers that provide contextual type info (typed VarDecl,
             # Return with declared return type) skip this path entirely,
             # so this error only fires for truly ambiguous empty arrays.
-            self.errors.append(TypeError("E0103", "Cannot infer type of empty array"))
+            self._report(TypeError("E0103", "Cannot infer type of empty array"))
             # Fallback to array of fraction to continue checking
-            return PELType(type_kind="Array", params={"element_type": PELType.fraction()}, dimension=Dimension.dimensionless())
+            return PELType.array(PELType.fraction())
+
+        # Arrays of plain numeric literals of one kind, or of currency
+        # literals with one symbol (seed data, lookup tables), need no
+        # per-element inference
+        first = expr.elements[0]
+        if type(first) is Literal:
+            literal_type = first.literal_type
+            numeric_type = _NUMERIC_LITERAL_TYPES.get(literal_type)
+            if numeric_type is not None:
+                if all(type(elem) is Literal and elem.literal_type == literal_type for elem in expr.elements):
+                    return PELType.array(numeric_type)
+            elif literal_type == "currency":
+                symbol = first.value[:1]
+                if all(
+                    type(elem) is Literal and elem.literal_type == "currency" and elem.value[:1] == symbol
+                    for elem in expr.elements
+                ):
+                    return PELType.array(_CURRENCY_LITERAL_TYPES.get(symbol) or PELType.currency("USD"))
 
         # Infer element type from first element
         element_type = self.infer_expression(expr.elements[0])
 
-        # Check all elements have compatible types
-        for elem in expr.elements[1:]:
+        # Check all elements have compatible types. Equal types are always
+        # compatible, which settles homogeneous literals without the full rules.
+        for elem in islice(expr.elements, 1, None):
             elem_type = self.infer_expression(elem)
+            if elem_type is element_type or elem_type == element_type:
+                continue
             if not self.types_compatible(element_type, elem_type):
-                self.errors.append(self.create_enhanced_type_error(element_type, elem_type))
+                self._report(self.create_enhanced_type_error(element_type, elem_type))
 
-        return PELType(
-            type_kind="Array",
-            params={"element_type": element_type},
-            dimension=Dimension.dimensionless()
-        )
+        return PELType.array(element_type)
 
     def infer_indexing(self, expr: Indexing) -> PELType:
         """Infer type of indexing expression."""
@@ -1097,20 +1651,17 @@ class TypeChecker:
         # Allow flexible indexing for timestep variables
         if array_type.type_kind == "TimeSeries":
             # Allow Int type, or Variables/expressions that could be timestep indices
-            if index_type.type_kind != "Int" and not isinstance(expr.index, (Variable, BinaryOp)):
-                self.errors.append(TypeError("E0102", "Index must be Int or timestep variable"))
+            if index_type.type_kind != "Int" and not isinstance(expr.index, _TIMESTEP_INDEX_NODES):
+                self._report(TypeError("E0102", "Index must be Int or timestep variable"))
             return array_type.params.get("inner", PELType.fraction())
 
         # For Array[i], return element type
         elif array_type.type_kind == "Array":
             # If indexing a literal array with a literal integer, check bounds at compile time
             if isinstance(expr.expression, ArrayLiteral) and isinstance(expr.index, Literal) and expr.index.literal_type == "integer":
-                try:
-                    idx_val = int(expr.index.value)
-                    if idx_val < 0 or idx_val >= len(expr.expression.elements):
-                        self.errors.append(TypeError("E0302", "Index out of bounds"))
-                except Exception:
-                    pass
+                idx_val = _index_value(expr.index)
+                if idx_val is not None and not 0 <= idx_val < len(expr.expression.elements):
+                    self._report(TypeError("E0302", "Index out of bounds"))
             return array_type.params.get("element_type", PELType.fraction())
 
         else:
@@ -1121,76 +1672,83 @@ class TypeChecker:
 
     def ast_type_to_pel_type(self, ast_type: TypeAnnotation) -> PELType:
         """Convert AST type annotation to PELType."""
-        if ast_type.type_kind == "Currency":
-            code = ast_type.params.get("currency_code", "USD")
-            return PELType.currency(code)
-
-        elif ast_type.type_kind == "Rate":
-            time_unit = ast_type.params.get("per", "Month")
-            return PELType.rate(time_unit)
+        builder = self._type_builders.get(ast_type.type_kind)
+        if builder is None:
+            if not ast_type.params:
+                cached = _PLAIN_TYPES.get(ast_type.type_kind)
+                if cached is not None:
+                    return cached
+            # Generic fallback. The kind comes from source text, so intern it:
+            # the checker's kind tests compare against interned literals, and
+            # str equality succeeds on identity before comparing characters.
+            return PELType(
+                type_kind=sys.intern(ast_type.type_kind),
+                params=ast_type.params,
+                dimension=Dimension.dimensionless()
+            )
+        return builder(ast_type)
 
-        elif ast_type.type_kind == "Duration":
-            time_unit = ast_type.params.get("unit")
-            return PELType.duration(time_unit)
+    def _build_currency_type(self, ast_type: TypeAnnotation) -> PELType:
+        code = ast_type.params.get("currency_code", "USD")
+        return PELType.currency(code)
 
-        elif ast_type.type_kind == "Fraction":
-            return PELType.fraction()
+    def _build_rate_type(self, ast_type: TypeAnnotation) -> PELType:
+        time_unit = ast_type.params.get("per", "Month")
+        return PELType.rate(time_unit)
 
-        elif ast_type.type_kind == "Count":
-            entity = ast_type.params.get("entity")
-            per = ast_type.params.get("per")
-            return PELType.count(entity, per)
+    def _build_duration_type(self, ast_type: TypeAnnotation) -> PELType:
+        time_unit = ast_type.params.get("unit")
+        return PELType.duration(time_unit)
 
-        elif ast_type.type_kind == "Capacity":
-            resource = ast_type.params.get("resource") or ast_type.params.get("entity") or "Units"
-            return PELType.capacity(resource)
+    def _build_fraction_type(self, ast_type: TypeAnnotation) -> PELType:
+        return PELType.fraction()
 
-        elif ast_type.type_kind == "Boolean":
-            return PELType.boolean()
+    def _build_count_type(self, ast_type: TypeAnnotation) -> PELType:
+        entity = ast_type.params.get("entity")
+        per = ast_type.params.get("per")
+        return PELType.count(entity, per)
 
-        elif ast_type.type_kind == "TimeSeries":
-            inner_param = ast_type.params.get("inner")
-            if isinstance(inner_param, TypeAnnotation):
-                inner_type = self.ast_type_to_pel_type(inner_param)
-            else:
-                inner_type = PELType.fraction()
-            return PELType.timeseries(inner_type)
+    def _build_capacity_type(self, ast_type: TypeAnnotation) -> PELType:
+        resource = ast_type.params.get("resource") or ast_type.params.get("entity") or "Units"
+        return PELType.capacity(resource)
 
-        elif ast_type.type_kind == "Array":
-            # Convert Array<Inner> to PELType with concrete element_type
-            inner_param = ast_type.params.get("inner")
-            if isinstance(inner_param, TypeAnnotation):
-                element_type = self.ast_type_to_pel_type(inner_param)
-            elif isinstance(inner_param, PELType):
-                element_type = inner_param
-            else:
-                element_type = PELType.fraction()
+    def _build_boolean_type(self, ast_type: TypeAnnotation) -> PELType:
+        return PELType.boolean()
 
-            return PELType(
-                type_kind="Array",
-                params={"element_type": element_type},
-                dimension=Dimension.dimensionless(),
-            )
+    def _build_wrapper_type(self, ast_type: TypeAnnotation) -> PELType:
+        """TimeSeries/Distribution/Array annotations, e.g. TimeSeries<Currency<USD>>.
 
-        elif ast_type.type_kind == "Distribution":
-            inner_param = ast_type.params.get("inner")
+        Nested wrappers are peeled off in a loop and the innermost type is
+        wrapped back up, so deep nesting does not recurse.
+        """
+        factories = []
+        node = ast_type
+        while True:
+            factory = _WRAPPER_FACTORIES.get(node.type_kind)
+            if factory is None:
+                pel_type = self.ast_type_to_pel_type(node)
+                break
+            factories.append(factory)
+            inner_param = node.params.get("inner")
             if isinstance(inner_param, TypeAnnotation):
-                inner_type = self.ast_type_to_pel_type(inner_param)
+                node = inner_param
+                continue
+            # Array<...> may already carry a concrete element type; a missing
+            # inner type means Fraction
+            if isinstance(inner_param, PELType) and node.type_kind == "Array":
+                pel_type = inner_param
             else:
-                inner_type = PELType.fraction()
-            return PELType.distribution(inner_type)
+                pel_type = PELType.fraction()
+            break
 
-        else:
-            # Generic fallback
-            return PELType(
-                type_kind=ast_type.type_kind,
-                params=ast_type.params,
-                dimension=Dimension.dimensionless()
-            )
+        for factory in reversed(factories):
+            pel_type = factory(pel_type)
+        return pel_type
 
     def pel_type_to_ast_type(self, pel_type: PELType) -> TypeAnnotation:
         """Convert PELType to AST type annotation."""
-        return TypeAnnotation(type_kind=pel_type.type_kind, params=pel_type.params)
+        # Copy params: PELType instances may be shared, annotations are not.
+        return TypeAnnotation(type_kind=pel_type.type_kind, params=dict(pel_type.params))
 
     def types_compatible(self, t1: PELType, t2: PELType) -> bool:
         """Check if two types are compatible.
@@ -1207,91 +1765,30 @@ class TypeChecker:
         Future phases will integrate semantic contract enforcement directly into this
         method, tightening these rules while maintaining upgrade paths for existing code.
         """
-        # Allow Int literals to be implicitly coerced to Count types (not Count-per-time)
-        if t1.type_kind == "Count" and t2.type_kind == "Int" and t1.params.get("per") is None:
-            return True
-
-        # Allow Count to be assigned to Int (Count is a semantic wrapper around Int)
-        if t1.type_kind == "Int" and t2.type_kind == "Count":
-            return True
-
-        # Allow generic Count to be compatible with specific Count<Entity>
-        # Entity tags are semantic metadata (Person, Applicant, Server, ...),
-        # not physical dimensions.  A function that converts Count<Applicant>
-        # to Count<Person> is valid (e.g. hiring funnel).  We still require
-        # the "per" parameter to match (it carries temporal dimension).
-        if t1.type_kind == "Count" and t2.type_kind == "Count":
-            per1 = t1.params.get("per")
-            per2 = t2.params.get("per")
-            if per1 != per2:
-                return False
-            return True
-
-        # Allow Int literals to be coerced to dimensionless types like Fraction
-        if t1.dimension.units == {} and t2.type_kind == "Int":
-            return True
-
-        # Allow Product types (from Count * Count) to be assignable to Count when explicitly typed
-        # This handles: var customers: Count<Customer> = count_a * count_b
-        if t1.type_kind == "Count" and t2.type_kind == "Product":
-            return True
-
-        # Allow Product types to be assignable to Currency when explicitly typed
-        # This handles: var revenue: Currency<USD> = count * rate (where rate has currency dimension)
-        if t1.type_kind == "Currency" and t2.type_kind == "Product":
-            return True
-
-        # Allow Product types to be assignable to Rate when explicitly typed
-        # This handles: var alloc: Rate per Month = demand * ratio
-        if t1.type_kind == "Rate" and t2.type_kind == "Product":
-            return True
-
-        # Allow Product types to be assignable to Fraction when explicitly typed
-        # This handles: var ratio: Fraction = a * b (both dimensionless)
-        if t1.type_kind == "Fraction" and t2.type_kind == "Product":
-            return True
-
-        # Allow Product types to be assignable to Duration when explicitly typed
-        if t1.type_kind == "Duration" and t2.type_kind == "Product":
+        # Shared instances make the most common case a single pointer compare.
+        if t1 is t2:
             return True
 
-        # Allow Fraction to be assignable to Count when explicitly typed
-        # This handles: var customers: Count<Customer> = revenue / price (evaluates to Fraction)
-        if t1.type_kind == "Count" and t2.type_kind == "Fraction":
-            return True
-
-        # Allow Quotient types (from division) to be assignable to Fraction when explicitly typed
-        # This handles: var ratio: Fraction = a / b
-        # Semantic contract: FractionFromRatio, QuotientNormalization
-        if t1.type_kind == "Fraction" and t2.type_kind == "Quotient":
-            return True
-
-        # Allow Quotient types to be assignable to Currency when explicitly typed
-        # This handles: var avg_price: Currency<USD> = total_revenue / count
-        # Semantic contract: RevenuePerUnit_to_Price, RateNormalization
-        if t1.type_kind == "Currency" and t2.type_kind == "Quotient":
-            return True
-
-        # Allow Quotient types to be assignable to Rate when explicitly typed
-        # This handles: var churn_rate: Rate per Month = churned / total
-        # Semantic contract: RateNormalization, QuotientNormalization
-        if t1.type_kind == "Rate" and t2.type_kind == "Quotient":
-            return True
+        t1_kind = t1.type_kind
+        t2_kind = t2.type_kind
+        if t1_kind == t2_kind:
+            return self._same_kind_compatible(t1, t2)
 
-        # Allow Quotient types to be assignable to Duration when explicitly typed
-        # This handles: var lead_time: Duration<Month> = total_time / stages
-        if t1.type_kind == "Duration" and t2.type_kind == "Quotient":
+        # Unconditional implicit conversions (see _COERCIBLE_KIND_PAIRS)
+        if (t1_kind, t2_kind) in _COERCIBLE_KIND_PAIRS:
             return True
 
-        # Allow Quotient types to be assignable to Int when explicitly typed
-        # This handles: var idx: Int = total / divisor
-        if t1.type_kind == "Int" and t2.type_kind == "Quotient":
-            return True
+        if t2_kind == "Int":
+            # Allow Int literals to be implicitly coerced to Count types (not Count-per-time)
+            if t1_kind == "Count" and t1.params.get("per") is None:
+                return True
+            # Allow Int literals to be coerced to dimensionless types like Fraction
+            return not t1.dimension.units
 
         # Allow Quotient types to be assignable to Count when explicitly typed
         # This handles: var customers: Count<Customer> = revenue / price_per_customer
         # Semantic contract: CountAggregation
-        if t1.type_kind == "Count" and t2.type_kind == "Quotient":
+        if t1_kind == "Count" and t2_kind == "Quotient":
             if t1.params.get("per") is not None:
                 expected_units: dict[str, Any] = {}
                 expected_entity = t1.params.get("entity")
@@ -1301,8 +1798,27 @@ class TypeChecker:
                 return t2.dimension.units == expected_units
             return True
 
+        # Different type kinds are otherwise incompatible
+        return False
+
+    def _same_kind_compatible(self, t1: PELType, t2: PELType) -> bool:
+        """types_compatible for two types of the same kind."""
+        kind = t1.type_kind
+
+        # Allow generic Count to be compatible with specific Count<Entity>
+        # Entity tags are semantic metadata (Person, Applicant, Server, ...),
+        # not physical dimensions.  A function that converts Count<Applicant>
+        # to Count<Person> is valid (e.g. hiring funnel).  We still require
+        # the "per" parameter to match (it carries temporal dimension).
+        if kind == "Count":
+            return t1.params.get("per") == t2.params.get("per")
+
+        # Int into a dimensionless Int
+        if kind == "Int" and not t1.dimension.units:
+            return True
+
         # Array compatibility: element types must be compatible
-        if t1.type_kind == "Array" and t2.type_kind == "Array":
+        if kind == "Array":
             el1 = t1.params.get("element_type") or t1.params.get("inner")
             el2 = t2.params.get("element_type") or t2.params.get("inner")
             # If element types are AST TypeAnnotation (inner), convert to PELType
@@ -1314,21 +1830,12 @@ class TypeChecker:
                 return False
             return self.types_compatible(el1, el2)
 
-        # Allow Rate to be assigned to Currency (for simplified benchmarks)
-        # This handles: param price: Currency<USD> = $10/1mo (should be Rate but typed as Currency)
-        if t1.type_kind == "Currency" and t2.type_kind == "Rate":
-            return True
-
-        # Same type kind
-        if t1.type_kind != t2.type_kind:
-            return False
-
         # Check dimensional compatibility
         if not self.dimensions_compatible(t1.dimension, t2.dimension):
             return False
 
         # Check parameters (for nominal types like Currency)
-        if t1.type_kind == "Currency":
+        if kind == "Currency":
             return t1.params.get("currency_code") == t2.params.get("currency_code")
 
         # Generic compatibility
@@ -1337,28 +1844,42 @@ class TypeChecker:
     def dimensions_compatible(self, d1: Dimension, d2: Dimension) -> bool:
         """Check if two dimensions are compatible for operations like addition."""
 
+        if d1 is d2:
+            return True
+
+        shape1 = d1._shape
+        shape2 = d2._shape
+
+        # Dimensionless operands (ratios, percentages, counters) are the most
+        # common case; settle them from the shape tags alone. Rates may be
+        # compared with dimensionless values.
+        if shape1 == _DIM_EMPTY:
+            return shape2 == _DIM_EMPTY or shape2 == _DIM_RATE
+        if shape2 == _DIM_EMPTY:
+            return shape1 == _DIM_RATE
+
         if d1 == d2:
             return True
 
         # Allow generic Duration to be compatible with unit-specific Duration.
-        if set(d1.units.keys()) == {"time"} and set(d2.units.keys()) == {"time"}:
-            return d1.units.get("time") == "generic" or d2.units.get("time") == "generic"
+        if shape1 == _DIM_TIME and shape2 == _DIM_TIME:
+            return d1._time == "generic" or d2._time == "generic"
 
         # Special case: Rate per TimeUnit compatibility
-        if "rate" in d1.units and "rate" in d2.units:
-            return d1.units["rate"] == d2.units["rate"]
-
-        # Allow Rate to be compared with dimensionless values
-        if "rate" in d1.units and not d2.units:
-            return True
-        if "rate" in d2.units and not d1.units:
-            return True
+        if shape1 == _DIM_RATE and shape2 == _DIM_RATE:
+            return d1._rate == d2._rate
 
         return False
 
+    def _report(self, error: CompilerError) -> None:
+        """Record a type error, stopping a fail-fast check (see check)."""
+        self.errors.append(error)
+        if self._fail_fast:
+            raise _StopChecking
+
     def has_errors(self) -> bool:
         """Check if type checking produced errors."""
-        return len(self.errors) > 0
+        return bool(self.errors)
 
     def get_errors(self) -> list[CompilerError]:
         """Get list of type errors."""
@@ -1378,7 +1899,7 @@ class TypeChecker:
         applicable semantic contracts that might justify the conversion.
         """
         # Get basic error
-        error = type_mismatch(str(expected_type), str(got_type), location)
+        error = type_mismatch(expected_type, got_type, location)
 
         # Add semantic contract hint if applicable
         hint = self.suggest_semantic_contract(got_type, expected_type)
@@ -1507,84 +2028,139 @@ class TypeChecker:
         parameters with literal values. Returns None if the expression cannot be
         statically evaluated.
 
-        Used for compile-time constraint checking.
+        Used for compile-time constraint checking. Results are memoized per
+        node, so parameters referenced from many constraints are evaluated once.
         """
-        # Literal values
-        if isinstance(expr, Literal):
-            if expr.literal_type in ("currency", "rate", "duration"):
-                # Extract numeric value from currency literals like "$100", "$100.50/1mo"
-                value_str = str(expr.value)
-                # Remove currency symbols ($, £, €, etc.) and extract number
-                # Match optional sign, then digits with optional decimal point
-                match = re.search(r'([+-]?[\d.]+)', value_str)
-                if match:
-                    return float(match.group(1))
-                return None
-            elif expr.literal_type in ("number", "integer"):
-                return float(expr.value) if '.' in str(expr.value) else int(expr.value)
-            elif expr.literal_type == "boolean":
-                return expr.value
-            return None
-
-        # Variable references (look up parameter values)
-        if isinstance(expr, Variable):
-            # Look up in static_values (parameters with literal values)
-            if expr.name in self.static_values:
-                # Recursively evaluate the stored literal
-                return self._evaluate_static_expression(self.static_values[expr.name])
-            return None
+        cached = self._static_eval_cache.get(id(expr))
+        if cached is not None:
+            return cached[1]
+        value = self._run_static_program(self._static_program(expr))
+        self._static_eval_cache[id(expr)] = (expr, value)
+        return value
+
+    def _static_program(self, expr: Expression) -> tuple[tuple[int, Any], ...]:
+        """Return the postfix program for `expr`, lowering it on first use.
+
+        Programs depend only on the shape of the tree (parameter values are
+        loaded at run time), so they are kept for the checker's lifetime.
+        """
+        return self._static_program_entry(expr)[1]
+
+    def _static_free_vars(self, expr: Expression) -> frozenset[str]:
+        """Names of the parameters a static program for `expr` loads."""
+        return self._static_program_entry(expr)[2]
+
+    def _static_program_entry(
+        self, expr: Expression
+    ) -> tuple[Expression, tuple[tuple[int, Any], ...], frozenset[str]]:
+        cached = self._static_programs.get(id(expr))
+        if cached is not None:
+            return cached
+        instructions: list[tuple[int, Any]] = []
+        self._lower_static_expression(expr, instructions)
+        program = tuple(instructions)
+        free_vars = frozenset(arg for opcode, arg in program if opcode == _OP_LOAD)
+        entry = self._static_programs[id(expr)] = (expr, program, free_vars)
+        return entry
+
+    def _lower_static_expression(self, expr: Expression, out: list[tuple[int, Any]]) -> None:
+        """Append the postfix instructions evaluating `expr` to `out`.
+
+        Uses an explicit work stack, so deeply nested operator chains do not
+        hit the recursion limit. Pending instructions sit on the stack below
+        the operands they consume.
+        """
+        work: list[Any] = [expr]
+        while work:
+            node = work.pop()
+            if node.__class__ is tuple:
+                # Fold operators whose operands are all constants, so subtrees
+                # without parameters cost a single instruction at run time.
+                opcode, fn = node
+                if opcode == _OP_UNARY and out[-1][0] == _OP_CONST:
+                    operand_val = out[-1][1]
+                    out[-1] = (_OP_CONST, None if operand_val is None else fn(operand_val))
+                elif opcode == _OP_BINARY and out[-1][0] == _OP_CONST and out[-2][0] == _OP_CONST:
+                    right_val = out.pop()[1]
+                    left_val = out[-1][1]
+                    out[-1] = (
+                        _OP_CONST,
+                        None if left_val is None or right_val is None else fn(left_val, right_val),
+                    )
+                else:
+                    out.append(node)
+                continue
 
-        # Unary operations
-        if isinstance(expr, UnaryOp):
-            operand_val = self._evaluate_static_expression(expr.operand)
-            if operand_val is None:
-                return None
-
-            op = expr.operator
-            if op == '-':
-                return -operand_val
-            elif op == '+':
-                return operand_val
-            elif op == 'not':
-                return not operand_val
-            return None
+            # Branch on the node's kind tag, as infer_expression does, rather
+            # than testing the node against each class in turn.
+            kind = getattr(node, "NODE_KIND", ExprKind.UNKNOWN)
+            if kind == ExprKind.LITERAL:
+                out.append((_OP_CONST, self._static_literal_value(node)))
+
+            elif kind == ExprKind.VARIABLE:
+                # Parameter values are looked up when the program runs
+                out.append((_OP_LOAD, node.name))
+
+            elif kind == ExprKind.UNARY_OP:
+                fn = _STATIC_UNARY_OPS.get(node.operator)
+                if fn is None:
+                    out.append((_OP_CONST, None))
+                    continue
+                work.append((_OP_UNARY, fn))
+                work.append(node.operand)
+
+            elif kind == ExprKind.BINARY_OP:
+                fn = _STATIC_BINARY_OPS.get(node.operator)
+                if fn is None:
+                    out.append((_OP_CONST, None))
+                    continue
+                work.append((_OP_BINARY, fn))
+                work.append(node.right)
+                work.append(node.left)
 
-        # Binary operations
-        if isinstance(expr, BinaryOp):
-            left_val = self._evaluate_static_expression(expr.left)
-            right_val = self._evaluate_static_expression(expr.right)
-
-            if left_val is None or right_val is None:
-                return None
-
-            op = expr.operator
-            if op == '+':
-                return left_val + right_val
-            elif op == '-':
-                return left_val - right_val
-            elif op == '*':
-                return left_val * right_val
-            elif op == '/':
-                return left_val / right_val if right_val != 0 else None
-            elif op == '==':
-                return left_val == right_val
-            elif op == '!=':
-                return left_val != right_val
-            elif op == '<':
-                return left_val < right_val
-            elif op == '<=':
-                return left_val <= right_val
-            elif op == '>':
-                return left_val > right_val
-            elif op == '>=':
-                return left_val >= right_val
-            elif op == 'and':
-                return left_val and right_val
-            elif op == 'or':
-                return left_val or right_val
+            else:
+                # Other expression types cannot be evaluated statically
+                out.append((_OP_CONST, None))
+
+    def _run_static_program(self, program: tuple[tuple[int, Any], ...]) -> Any:
+        """Execute a postfix program; None operands propagate to the result."""
+        stack: list[Any] = []
+        for opcode, arg in program:
+            if opcode == _OP_CONST:
+                stack.append(arg)
+            elif opcode == _OP_LOAD:
+                # Look up in static_values (parameters with literal values)
+                value_expr = self.static_values.get(arg)
+                stack.append(None if value_expr is None else self._evaluate_static_expression(value_expr))
+            elif opcode == _OP_UNARY:
+                operand_val = stack[-1]
+                if operand_val is not None:
+                    stack[-1] = arg(operand_val)
+            else:
+                right_val = stack.pop()
+                left_val = stack[-1]
+                stack[-1] = None if left_val is None or right_val is None else arg(left_val, right_val)
+        return stack[-1]
+
+    def _static_literal_value(self, expr: Literal) -> Any:
+        """Numeric (or boolean) value of a literal, or None if it has none."""
+        if expr.literal_type in ("currency", "rate", "duration"):
+            # Extract numeric value from currency literals like "$100", "$100.50/1mo"
+            value_str = str(expr.value)
+            # Plain amounts like "$100" need no pattern matching
+            digits = value_str.lstrip("$€£¥")
+            if digits.isascii() and digits.isdigit():
+                return float(digits)
+            # Remove currency symbols ($, £, €, etc.) and extract number
+            # Match optional sign, then digits with optional decimal point
+            match = _NUMBER_RE.search(value_str)
+            if match:
+                return float(match.group(1))
             return None
-
-        # Other expression types
+        elif expr.literal_type in ("number", "integer"):
+            return float(expr.value) if '.' in str(expr.value) else int(expr.value)
+        elif expr.literal_type == "boolean":
+            return expr.value
         return None
 
     def generate_contract_report(self, model: Model) -> str:
@@ -1607,57 +2183,72 @@ class TypeChecker:
         # Analyze variables for type conversions
         for var in model.vars:
             if var.type_annotation and var.value:
-                var_type = self.ast_type_to_pel_type(var.type_annotation)
-                value_type = self.infer_expression(var.value)
+                checked = self._var_types.get(var.name)
+                if checked is not None and checked[0] is var:
+                    # Already typed by check_model
+                    _, var_type, value_type = checked
+                    if value_type is None:
+                        value_type = self.infer_expression(var.value)
+                else:
+                    var_type = self.ast_type_to_pel_type(var.type_annotation)
+                    value_type = self.infer_expression(var.value)
+                # Equal types render identically: no conversion to report
+                if var_type is value_type or var_type == value_type:
+                    continue
+                from_type = str(value_type)
+                to_type = str(var_type)
 
                 # Check if there's a type conversion happening
-                if str(var_type) != str(value_type):
+                if from_type != to_type:
                     contracts = self.find_applicable_contracts(value_type, var_type)
 
                     conversion_info = {
                         'variable': var.name,
-                        'from_type': str(value_type),
-                        'to_type': str(var_type),
+                        'from_type': from_type,
+                        'to_type': to_type,
                         'contracts': contracts,
                         'is_compatible': self.types_compatible(var_type, value_type)
                     }
                     conversions_found.append(conversion_info)
 
+        justified = [c for c in conversions_found if c['contracts']]
+        unjustified = [c for c in conversions_found if not c['contracts']]
+
         # Report conversions
         if conversions_found:
             report.append("## Type Conversions Detected\n\n")
 
-            justified = [c for c in conversions_found if c['contracts']]
-            unjustified = [c for c in conversions_found if not c['contracts']]
-
             if justified:
                 report.append(f"### Justified Conversions ({len(justified)})\n\n")
                 for conv in justified:
-                    report.append(f"**Variable: `{conv['variable']}`**\n")
-                    report.append(f"  - Conversion: `{conv['from_type']}` → `{conv['to_type']}`\n")
-                    report.append(f"  - Compatible: {'✓' if conv['is_compatible'] else '✗'}\n")
-                    report.append("  - Contracts:\n")
-                    for contract in conv['contracts']:  # type: ignore[attr-defined]
-                        report.append(f"    - {contract.name} ({contract.reason.value})\n")
-                    report.append("\n")
+                    report.append(_JUSTIFIED_CONVERSION_TEMPLATE.format(
+                        variable=conv['variable'],
+                        from_type=conv['from_type'],
+                        to_type=conv['to_type'],
+                        compatible='✓' if conv['is_compatible'] else '✗',
+                        contracts="".join(
+                            f"    - {contract.name} ({contract.reason.value})\n"
+                            for contract in conv['contracts']  # type: ignore[attr-defined]
+                        ),
+                    ))
 
             if unjustified:
                 report.append(f"### Unjustified Conversions ({len(unjustified)})\n\n")
                 for conv in unjustified:
-                    report.append(f"**Variable: `{conv['variable']}`**\n")
-                    report.append(f"  - Conversion: `{conv['from_type']}` → `{conv['to_type']}`\n")
-                    report.append(f"  - Compatible: {'✓' if conv['is_compatible'] else '✗'}\n")
-                    report.append("  - ⚠️  NO SEMANTIC CONTRACT FOUND\n")
-                    report.append("  - Recommendation: Verify this conversion is correct\n")
-                    report.append("\n")
+                    report.append(_UNJUSTIFIED_CONVERSION_TEMPLATE.format(
+                        variable=conv['variable'],
+                        from_type=conv['from_type'],
+                        to_type=conv['to_type'],
+                        compatible='✓' if conv['is_compatible'] else '✗',
+                    ))
         else:
             report.append("No type conversions detected.\n\n")
 
         # Summary
         report.append("\n## Summary\n\n")
         total = len(conversions_found)
-        justified_count = len([c for c in conversions_found if c['contracts']])
-        unjustified_count = total - justified_count
+        justified_count = len(justified)
+        unjustified_count = len(unjustified)
 
         report.append(f"- Total conversions: {total}\n")
         report.append(f"- Justified by contracts: {justified_count}\n")
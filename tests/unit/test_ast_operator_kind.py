@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+
+from compiler.ast_nodes import BinaryOp, ExprKind, Literal, OpKind
+from compiler.lexer import Lexer
+from compiler.parser import Parser
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("operator", "kind"),
+    [("+", OpKind.ADD), ("/", OpKind.DIV), ("<=", OpKind.LE), ("&&", OpKind.AND), ("??", OpKind.UNKNOWN)],
+)
+def test_binary_op_resolves_operator_kind(operator: str, kind: OpKind) -> None:
+    expr = BinaryOp(operator, Literal("1", "integer"), Literal("2", "integer"))
+    assert expr.operator_kind is kind
+
+
+@pytest.mark.unit
+def test_operator_kind_is_not_part_of_node_equality() -> None:
+    a = BinaryOp("+", Literal("1", "integer"), Literal("2", "integer"))
+    b = BinaryOp("+", Literal("1", "integer"), Literal("2", "integer"))
+    assert a == b
+    assert "operator_kind" not in repr(a)
+
+
+@pytest.mark.unit
+def test_parser_binary_ops_carry_operator_kind() -> None:
+    src = "model m { var x: Fraction = 1 * 2 - 3 }"
+    model = Parser(Lexer(src).tokenize()).parse()
+    expr = model.vars[0].value
+    assert isinstance(expr, BinaryOp)
+    assert expr.operator_kind is OpKind.SUB
+    assert isinstance(expr.left, BinaryOp) and expr.left.operator_kind is OpKind.MUL
+
+
+@pytest.mark.unit
+def test_expression_classes_expose_distinct_node_kinds() -> None:
+    from compiler import ast_nodes
+
+    classes = [
+        cls
+        for cls in vars(ast_nodes).values()
+        if isinstance(cls, type) and issubclass(cls, ast_nodes.Expression) and cls.NODE_KIND is not ExprKind.UNKNOWN
+    ]
+    assert sorted(cls.NODE_KIND for cls in classes) == sorted(set(ExprKind) - {ExprKind.UNKNOWN})
+    assert Literal("1", "integer").NODE_KIND is ExprKind.LITERAL
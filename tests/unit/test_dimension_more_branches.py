@@ -74,3 +74,74 @@ def test_dimension_divide_currency_count_duration_and_generic_inversion() -> Non
     # Generic inversion path
     inverted = Dimension({"a": 1}).divide(Dimension({"b": 2}))
     assert inverted == Dimension({"a": 1, "inv_b": 2})
+
+
+@pytest.mark.unit
+def test_dimension_mirrors_tags_for_arithmetic() -> None:
+    d = Dimension({"currency": "USD", "scoped": "Customer"})
+    assert d._currency == "USD"
+    assert d._scoped == "Customer"
+    assert d._rate is None and d._time is None and d._count is None
+    assert not hasattr(d, "__dict__")
+    assert Dimension.currency("EUR").divide(Dimension.rate("Month")) == Dimension.currency("EUR")
+
+
+@pytest.mark.unit
+def test_dimension_hash_is_cached_and_consistent_with_equality() -> None:
+    d1 = Dimension({"currency": "USD", "per_time": "Month"})
+    d2 = Dimension({"per_time": "Month", "currency": "USD"})
+    assert hash(d1) == hash(d2)
+    assert d1._hash == hash(d1)
+    assert len({d1, d2, Dimension.dimensionless()}) == 2
+
+
+@pytest.mark.unit
+def test_dimension_arithmetic_results_are_reused_per_operand_pair() -> None:
+    usd = Dimension.currency("USD")
+    customers = Dimension.count("Customer")
+
+    assert usd.divide(customers) is Dimension({"currency": "USD"}).divide(customers)
+    assert customers.multiply(usd.divide(customers)) is customers.multiply(usd.divide(customers))
+
+    with pytest.raises(ValueError):
+        usd.divide(Dimension.currency("EUR"))
+    with pytest.raises(ValueError):
+        usd.divide(Dimension.currency("EUR"))
+
+
+@pytest.mark.unit
+def test_dimension_arithmetic_memos_stay_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    from compiler import typechecker
+
+    monkeypatch.setattr(typechecker, "_MEMO_LIMIT", 2)
+    for i in range(5):
+        entity = Dimension.count(f"Entity{i}")
+        assert entity.multiply(Dimension.currency("USD").divide(entity)) == Dimension.currency("USD")
+    assert len(typechecker._DIMENSION_PRODUCTS) <= 2
+    assert len(typechecker._DIMENSION_QUOTIENTS) <= 2
+
+
+@pytest.mark.unit
+def test_dimensionless_compatibility_is_settled_by_shape() -> None:
+    from compiler.typechecker import TypeChecker
+
+    tc = TypeChecker()
+    unshared = Dimension({})
+    assert unshared is not Dimension.dimensionless()
+    assert tc.dimensions_compatible(unshared, Dimension.dimensionless())
+    assert tc.dimensions_compatible(unshared, Dimension.rate("Month"))
+    assert tc.dimensions_compatible(Dimension.rate("Month"), unshared)
+    assert not tc.dimensions_compatible(unshared, Dimension.currency("USD"))
+    assert not tc.dimensions_compatible(Dimension.duration("Month"), unshared)
+
+
+@pytest.mark.unit
+def test_dimensionless_operands_return_the_other_dimension() -> None:
+    usd = Dimension.currency("USD")
+    per_month = Dimension.rate("Month")
+    scalar = Dimension({})
+
+    assert usd.multiply(scalar) is usd
+    assert scalar.multiply(per_month) is per_month
+    assert per_month.divide(scalar) is per_month
+    assert scalar.divide(per_month) == Dimension({"inv_rate": "Month"})
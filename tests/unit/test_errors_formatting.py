@@ -5,7 +5,9 @@ import pytest
 from compiler.errors import (
     CompilerError,
     SourceLocation,
+    dimensional_mismatch,
     invalid_number,
+    type_mismatch,
     unterminated_string,
 )
 
@@ -33,3 +35,45 @@ def test_invalid_number_and_unterminated_string_helpers_format() -> None:
     err2 = unterminated_string(SourceLocation(filename="m.pel", line=1, column=10))
     assert err2.code == "E0003"
     assert "Unterminated string literal" in str(err2)
+
+
+class _CountingType:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+
+    def __str__(self) -> str:
+        self.calls += 1
+        return self.text
+
+
+@pytest.mark.unit
+def test_mismatch_helpers_defer_formatting_until_read() -> None:
+    expected = _CountingType("Currency<USD>")
+    got = _CountingType("Fraction")
+    err = type_mismatch(expected, got)
+    assert expected.calls == 0 and got.calls == 0
+
+    assert err.message == "Type mismatch: expected Currency<USD>, got Fraction"
+    assert "error[E0100]" in str(err)
+    assert expected.calls == 1 and got.calls == 1
+
+    dim = dimensional_mismatch("add", _CountingType("A"), _CountingType("B"))
+    assert "Cannot add incompatible dimensions: A and B" in str(dim)
+
+
+@pytest.mark.unit
+def test_hint_attached_after_construction_is_formatted() -> None:
+    err = type_mismatch("Int", "Fraction")
+    err.hint = "convert explicitly"
+    assert "= hint: convert explicitly" in str(err)
+
+
+@pytest.mark.unit
+def test_args_and_repr_show_the_formatted_error() -> None:
+    err = type_mismatch("Int", "Fraction")
+    assert err.args == ("error[E0100]: Type mismatch: expected Int, got Fraction",)
+    assert "Type mismatch: expected Int, got Fraction" in repr(err)
+
+    err.hint = "convert explicitly"
+    assert err.args == (str(err),)
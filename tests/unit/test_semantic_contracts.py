@@ -254,6 +254,24 @@ class TestSemanticContractEdgeCases:
         with pytest.raises(ValueError, match="already registered"):
             SemanticContracts.register(REVENUE_PER_UNIT_TO_PRICE)
 
+    def test_find_conversions_sees_contracts_registered_after_lookup(self, monkeypatch):
+        """Cached lookups are invalidated when a contract is registered."""
+        monkeypatch.setattr(SemanticContracts, "_contracts", dict(SemanticContracts._contracts))
+        monkeypatch.setattr(SemanticContracts, "_conversion_cache", {})
+
+        assert SemanticContracts.find_conversions("Widget", "Gadget") == []
+
+        contract = SemanticContract(
+            name="WidgetToGadget",
+            source_type="Widget",
+            target_type="Gadget",
+            reason=ConversionReason.DOMAIN_SPECIFIC,
+            description="Test-only conversion",
+        )
+        SemanticContracts.register(contract)
+
+        assert SemanticContracts.find_conversions("Widget", "Gadget") == [contract]
+
     def test_contract_pattern_matching_edge_cases(self):
         """Test pattern matching with edge cases."""
         # Exact match
@@ -13,6 +13,8 @@ from compiler.ast_nodes import (
     Variable,
 )
 from compiler.errors import TypeError as PELTypeError
+from compiler.lexer import Lexer
+from compiler.parser import Parser
 from compiler.typechecker import PELType, TypeChecker, TypeEnvironment
 
 
@@ -26,6 +28,34 @@ def test_type_environment_parent_lookup_and_child_scope() -> None:
     assert child.lookup("missing") is None
 
 
+@pytest.mark.unit
+def test_type_environment_child_sees_later_parent_bindings_and_shadows() -> None:
+    parent = TypeEnvironment()
+    child = parent.child_scope()
+    grandchild = child.child_scope()
+
+    parent.bind("late", PELType.boolean())
+    child.bind_many({"late": PELType.currency("USD"), "y": PELType.fraction()})
+
+    assert grandchild.lookup("late") == PELType.currency("USD")
+    assert grandchild.lookup("y") == PELType.fraction()
+    assert parent.lookup("late") == PELType.boolean()
+    assert parent.lookup("y") is None
+
+
+@pytest.mark.unit
+def test_type_environment_lookup_does_not_cache_outer_bindings() -> None:
+    parent = TypeEnvironment()
+    child = parent.child_scope()
+
+    parent.bind("x", PELType.fraction())
+    assert child.lookup("x") is PELType.fraction()
+    parent.bind("x", PELType.boolean())
+
+    assert child.lookup("x") is PELType.boolean()
+    assert "x" not in child.bindings
+
+
 @pytest.mark.unit
 def test_peltype_repr_with_and_without_params() -> None:
     assert repr(PELType.fraction()) == "Fraction"
@@ -155,3 +185,74 @@ def test_typechecker_if_then_else_mismatch_records_error() -> None:
     inferred = tc.infer_expression(expr)
     assert inferred.type_kind == "Fraction"
     assert any(getattr(e, "code", None) == "E0100" for e in tc.errors)
+
+
+@pytest.mark.unit
+def test_type_environment_has_no_instance_dict() -> None:
+    env = TypeEnvironment().child_scope()
+    assert not hasattr(env, "__dict__")
+    with pytest.raises(AttributeError):
+        env.extra = {}  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+def test_type_annotations_have_no_instance_dict() -> None:
+    annotation = TypeChecker().pel_type_to_ast_type(PELType.currency("USD"))
+    assert not hasattr(annotation, "__dict__")
+    assert (annotation.type_kind, annotation.params, annotation.line) == ("Currency", {"currency_code": "USD"}, 0)
+
+
+@pytest.mark.unit
+def test_stdlib_signatures_are_parsed_once_and_not_shared_between_checkers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from compiler import typechecker
+
+    first = TypeChecker()
+    assert typechecker._STDLIB_SIGNATURES
+
+    parses = 0
+    original_parse = Parser.parse
+
+    def counting_parse(self: Parser):  # type: ignore[no-untyped-def]
+        nonlocal parses
+        parses += 1
+        return original_parse(self)
+
+    monkeypatch.setattr(Parser, "parse", counting_parse)
+    second = TypeChecker()
+
+    assert parses == 0
+    assert second.functions.keys() == first.functions.keys()
+    name = next(iter(first.functions))
+    assert second.functions[name] == first.functions[name]
+    assert second.functions[name][0] is not first.functions[name][0]
+
+
+@pytest.mark.unit
+def test_check_stops_at_the_first_error_unless_asked_for_all() -> None:
+    source = """model M {
+    param price: Currency<USD> = $10
+    func f(x: Fraction) -> Fraction { return missing_a }
+    var a: Fraction = missing_b
+    var b: Fraction = missing_c
+}"""
+
+    fast = TypeChecker()
+    root_env = fast.env
+    with pytest.raises(PELTypeError) as first:
+        fast.check(Parser(Lexer(source).tokenize()).parse())
+    assert len(fast.errors) == 1
+    assert fast.env is root_env
+
+    full = TypeChecker()
+    with pytest.raises(PELTypeError) as collected:
+        full.check(Parser(Lexer(source).tokenize()).parse(), fail_fast=False)
+    assert len(full.errors) == 3
+    assert first.value.code == collected.value.code
+    assert first.value.message == collected.value.message
+
+    # The stop only applies inside check(); later checks collect every error
+    fast.errors = []
+    fast.check_model(Parser(Lexer(source).tokenize()).parse())
+    assert len(fast.errors) == 3
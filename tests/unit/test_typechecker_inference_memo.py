@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import pytest
+
+from compiler.ast_nodes import BinaryOp, Literal, Variable
+from compiler.lexer import Lexer
+from compiler.parser import Parser
+from compiler.typechecker import PELType, TypeChecker
+
+
+@pytest.mark.unit
+def test_infer_expression_reuses_result_for_same_node(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    original = TypeChecker.infer_literal
+
+    def counting_infer_literal(self: TypeChecker, lit: Literal):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        return original(self, lit)
+
+    monkeypatch.setattr(TypeChecker, "infer_literal", counting_infer_literal)
+
+    tc = TypeChecker()
+    expr = BinaryOp(
+        operator="+",
+        left=Literal(value="$1", literal_type="currency"),
+        right=Literal(value="$2", literal_type="currency"),
+    )
+
+    first = tc.infer_expression(expr)
+    second = tc.infer_expression(expr)
+
+    assert first is second
+    assert first.type_kind == "Currency"
+    assert calls == 2
+
+
+@pytest.mark.unit
+def test_infer_expression_does_not_memoize_ill_typed_nodes() -> None:
+    tc = TypeChecker()
+    expr = Variable(name="missing")
+
+    tc.infer_expression(expr)
+    tc.infer_expression(expr)
+
+    assert len(tc.errors) == 2
+
+
+@pytest.mark.unit
+def test_contract_report_reuses_types_inferred_by_check_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    source = """model TestModel {
+    param revenue: Currency<USD> = $100000
+    param customers: Count<Customer> = 100
+    var price: Currency<USD> = revenue / customers
+}"""
+    model = Parser(Lexer(source).tokenize()).parse_model()
+
+    calls = 0
+    original = TypeChecker.infer_binary_op
+
+    def counting_infer_binary_op(self: TypeChecker, expr: BinaryOp):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        return original(self, expr)
+
+    monkeypatch.setattr(TypeChecker, "infer_binary_op", counting_infer_binary_op)
+
+    tc = TypeChecker()
+    tc.check_model(model)
+    calls_after_check = calls
+    report = tc.generate_contract_report(model)
+
+    assert "price" in report
+    assert calls == calls_after_check == 1
+
+
+@pytest.mark.unit
+def test_contract_report_reuses_var_types_from_check_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    source = """model TestModel {
+    param revenue: Currency<USD> = $100000
+    param customers: Count<Customer> = 100
+    var price: Currency<USD> = revenue / customers
+}"""
+    model = Parser(Lexer(source).tokenize()).parse_model()
+    tc = TypeChecker()
+    tc.check_model(model)
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("var types should come from check_model")
+
+    monkeypatch.setattr(tc, "ast_type_to_pel_type", fail)
+    report = tc.generate_contract_report(model)
+
+    assert "Variable: `price`" in report
+    assert "- Total conversions: 1" in report
+
+
+@pytest.mark.unit
+def test_contract_report_reuses_declared_types_of_distribution_vars(monkeypatch: pytest.MonkeyPatch) -> None:
+    source = """model TestModel {
+    param base: Fraction = 0.5
+    var growth: Fraction = ~Normal(μ=0.1, σ=0.02)
+}"""
+    model = Parser(Lexer(source).tokenize()).parse_model()
+    tc = TypeChecker()
+    tc.check_model(model)
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("declared types should come from check_model")
+
+    monkeypatch.setattr(tc, "ast_type_to_pel_type", fail)
+    report = tc.generate_contract_report(model)
+
+    assert "Total conversions" in report
+
+
+@pytest.mark.unit
+def test_unannotated_function_local_reports_value_errors_once() -> None:
+    source = """model TestModel {
+    func f(x: Fraction) -> Fraction {
+        var y = missing + x
+        return y
+    }
+}"""
+    model = Parser(Lexer(source).tokenize()).parse_model()
+
+    tc = TypeChecker()
+    tc.check_model(model)
+
+    assert [e.code for e in tc.errors] == ["E0101"]
+
+
+@pytest.mark.unit
+def test_deferred_argument_mismatch_messages_name_each_argument() -> None:
+    source = """model TestModel {
+    func f(x: Currency<USD>, y: Currency<USD>) -> Currency<USD> {
+        return x + y
+    }
+    var total: Currency<USD> = f(1mo, 2mo)
+}"""
+    model = Parser(Lexer(source).tokenize()).parse_model()
+
+    tc = TypeChecker()
+    tc.check_model(model)
+
+    messages = [e.message for e in tc.errors if "argument" in e.message]
+    assert messages == [
+        "Type mismatch in function 'f' argument 1: expected Currency<currency_code=USD>, got Duration<unit=Month>",
+        "Type mismatch in function 'f' argument 2: expected Currency<currency_code=USD>, got Duration<unit=Month>",
+    ]
+
+
+@pytest.mark.unit
+def test_long_operator_chains_are_checked_without_deep_recursion() -> None:
+    terms = " + ".join(["a"] * 3000 + ["missing"])
+    source = f"""model TestModel {{
+    param a: Fraction = 0.5
+    var total: Fraction = {terms}
+}}"""
+    model = Parser(Lexer(source).tokenize()).parse_model()
+
+    tc = TypeChecker()
+    tc.check_model(model)
+
+    assert [e.code for e in tc.errors] == ["E0101"]
+    # Ill-typed nodes are only memoized while their declaration is checked
+    assert id(model.vars[0].value) not in tc._expr_type_cache
+    assert id(model.vars[0].value.right) not in tc._expr_type_cache
+
+
+@pytest.mark.unit
+def test_only_values_past_the_operator_threshold_are_inferred_bottom_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    from compiler.typechecker import _BOTTOM_UP_MIN_NODES
+
+    tc = TypeChecker()
+    tc.env.bind("a", PELType.fraction())
+    first_nodes: list[object] = []
+    original = TypeChecker.infer_expression
+
+    def recording_infer_expression(self: TypeChecker, expr):  # type: ignore[no-untyped-def]
+        first_nodes.append(expr)
+        return original(self, expr)
+
+    monkeypatch.setattr(TypeChecker, "infer_expression", recording_infer_expression)
+
+    for operator_count, inferred_from_root in ((_BOTTOM_UP_MIN_NODES - 1, True), (_BOTTOM_UP_MIN_NODES, False)):
+        expr = Parser(Lexer(" + ".join(["a"] * (operator_count + 1))).tokenize()).parse_expression()
+        first_nodes.clear()
+        assert tc._infer_bottom_up(expr).type_kind == "Fraction"
+        assert (first_nodes[0] is expr) is inferred_from_root
+
+
+@pytest.mark.unit
+def test_unannotated_var_value_is_inferred_once() -> None:
+    source = """model TestModel {
+    param a: Fraction = 0.5
+    var x = a + missing
+}"""
+    model = Parser(Lexer(source).tokenize()).parse_model()
+
+    tc = TypeChecker()
+    tc.check_model(model)
+
+    # Ill-typed values are not memoized, so a second inference would repeat the error
+    assert [e.code for e in tc.errors] == ["E0101"]
+    assert model.vars[0].type_annotation is not None
+    assert model.vars[0].type_annotation.type_kind == "Fraction"
+
+
+@pytest.mark.unit
+def test_index_bounds_check_only_consults_prior_array_declarations() -> None:
+    source = """model M {
+    var first = [1, 2, 3]
+    var x = first[5]
+    var y = later[5]
+    var later = [1, 2, 3]
+}"""
+    tc = TypeChecker()
+    tc.check_model(Parser(Lexer(source).tokenize()).parse_model())
+
+    assert [e.code for e in tc.errors if e.code == "E0302"] == ["E0302"]
+
+
+@pytest.mark.unit
+def test_function_signature_annotations_are_converted_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    source = """model M {
+    func margin(revenue: Currency<USD>, cost: Currency<USD>) -> Currency<USD> {
+        return revenue - cost
+    }
+}"""
+    model = Parser(Lexer(source).tokenize()).parse_model()
+    seen: list[int] = []
+    original = TypeChecker.ast_type_to_pel_type
+
+    def recording(self: TypeChecker, ast_type):  # type: ignore[no-untyped-def]
+        seen.append(id(ast_type))
+        return original(self, ast_type)
+
+    tc = TypeChecker()
+    monkeypatch.setattr(TypeChecker, "ast_type_to_pel_type", recording)
+    tc.check_model(model)
+
+    assert tc.errors == []
+    assert len(seen) == len(set(seen)) == 3
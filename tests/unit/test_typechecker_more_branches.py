@@ -5,13 +5,14 @@ import pytest
 from compiler.ast_nodes import (
     ArrayLiteral,
     BinaryOp,
+    Distribution,
     FunctionCall,
     Indexing,
     Literal,
     TypeAnnotation,
     Variable,
 )
-from compiler.typechecker import Dimension, TypeChecker
+from compiler.typechecker import Dimension, PELType, TypeChecker
 
 
 @pytest.mark.unit
@@ -128,3 +129,94 @@ def test_typechecker_indexing_scalar_returns_same_type() -> None:
 def test_dimension_divide_different_currencies_raises() -> None:
     with pytest.raises(ValueError):
         Dimension.currency("USD").divide(Dimension.currency("EUR"))
+
+
+@pytest.mark.unit
+def test_typechecker_homogeneous_array_skips_compatibility_rules(monkeypatch: pytest.MonkeyPatch) -> None:
+    tc = TypeChecker()
+
+    def fail(*_args: object) -> bool:
+        raise AssertionError("types_compatible should not be needed for equal element types")
+
+    monkeypatch.setattr(tc, "types_compatible", fail)
+    expr = ArrayLiteral(elements=[Literal(value=str(i), literal_type="integer") for i in range(5)])
+
+    inferred = tc.infer_expression(expr)
+
+    assert inferred.type_kind == "Array"
+    assert inferred.params["element_type"].type_kind == "Int"
+    assert tc.errors == []
+
+
+@pytest.mark.unit
+def test_typechecker_numeric_literal_arrays_keep_their_element_kind() -> None:
+    tc = TypeChecker()
+
+    floats = ArrayLiteral(elements=[Literal(value="1.5", literal_type="number"), Literal(value="2.5", literal_type="number")])
+    assert tc.infer_expression(floats).params["element_type"].type_kind == "Fraction"
+
+    mixed = ArrayLiteral(elements=[Literal(value="1", literal_type="integer"), Literal(value="2.5", literal_type="number")])
+    assert tc.infer_expression(mixed).params["element_type"].type_kind == "Int"
+    assert len(tc.errors) == 1
+
+
+@pytest.mark.unit
+def test_typechecker_currency_literal_arrays_use_the_shared_symbol() -> None:
+    tc = TypeChecker()
+
+    euros = ArrayLiteral(elements=[Literal(value="€10", literal_type="currency"), Literal(value="€20", literal_type="currency")])
+    assert tc.infer_expression(euros).params["element_type"] is PELType.currency("EUR")
+
+    mixed = ArrayLiteral(elements=[Literal(value="$10", literal_type="currency"), Literal(value="€20", literal_type="currency")])
+    assert tc.infer_expression(mixed).params["element_type"] is PELType.currency("USD")
+    assert len(tc.errors) == 1
+
+
+@pytest.mark.unit
+def test_duration_units_are_parsed_once_per_text() -> None:
+    from compiler import typechecker
+
+    typechecker._duration_unit.cache_clear()
+    assert typechecker._duration_unit("18mo") == "Month"
+    assert typechecker._duration_unit("2w") == "Week"
+    assert typechecker._duration_unit("soon") is None
+    assert typechecker._duration_unit("3d\n") is None
+    assert typechecker._duration_unit("18mo") == "Month"
+    assert typechecker._duration_unit("soon") is None
+
+    info = typechecker._duration_unit.cache_info()
+    assert (info.hits, info.misses) == (2, 4)
+    assert info.maxsize is not None
+
+
+@pytest.mark.unit
+def test_typechecker_distribution_reports_mismatches_after_inferring_params() -> None:
+    tc = TypeChecker()
+    dist = Distribution(
+        dist_type="Normal",
+        params={
+            "mu": Literal(value="$10", literal_type="currency"),
+            "sigma": Variable(name="missing"),
+        },
+    )
+
+    inferred = tc.infer_distribution(dist)
+
+    assert inferred == PELType.currency("USD")
+    assert [e.code for e in tc.errors] == ["E0101", "E0104"]
+
+
+@pytest.mark.unit
+def test_typechecker_literal_index_bounds_accept_int_and_text_values() -> None:
+    def errors_for(index_value: object) -> list[str]:
+        tc = TypeChecker()
+        arr = ArrayLiteral(elements=[Literal(value=1, literal_type="integer"), Literal(value=2, literal_type="integer")])
+        tc.infer_expression(Indexing(expression=arr, index=Literal(value=index_value, literal_type="integer")))
+        return [e.code for e in tc.errors]
+
+    assert errors_for(1) == []
+    assert errors_for(2) == ["E0302"]
+    assert errors_for(-1) == ["E0302"]
+    assert errors_for("5") == ["E0302"]
+    assert errors_for("x") == []
+    assert errors_for(float("inf")) == []
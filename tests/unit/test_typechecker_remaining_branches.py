@@ -148,3 +148,9 @@ def test_typechecker_types_compatible_currency_dim_mismatch_and_warnings_getter(
     tc = TypeChecker()
     assert not tc.types_compatible(PELType.currency("USD"), PELType.currency("EUR"))
     assert tc.get_warnings() == []
+
+
+@pytest.mark.unit
+def test_typechecker_infer_expression_fallback_for_non_ast_object() -> None:
+    tc = TypeChecker()
+    assert tc.infer_expression(object()) is PELType.fraction()  # type: ignore[arg-type]
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import pytest
 
-from compiler.ast_nodes import BinaryOp, Literal, UnaryOp, Variable
+from compiler.ast_nodes import BinaryOp, Literal, Model, UnaryOp, Variable
 from compiler.typechecker import TypeChecker
 
 
@@ -324,3 +324,97 @@ def test_evaluate_static_literal_unsupported_type() -> None:
     # String literals are not used for static constraint evaluation
     result = tc._evaluate_static_expression(Literal("hello", "string"))
     assert result is None
+
+
+@pytest.mark.unit
+def test_evaluate_static_memoizes_shared_parameter_values() -> None:
+    """Parameter values referenced from several expressions are evaluated once."""
+    tc = TypeChecker()
+    price = Literal("$100", "currency")
+    tc.static_values["price"] = price
+
+    assert tc._evaluate_static_expression(BinaryOp(">=", Variable("price"), Literal("0", "integer"))) is True
+    assert tc._static_eval_cache[id(price)] == (price, 100.0)
+    assert tc._evaluate_static_expression(BinaryOp("<", Variable("price"), Literal("50", "integer"))) is False
+
+
+@pytest.mark.unit
+def test_evaluate_static_cache_is_not_fooled_by_fresh_nodes() -> None:
+    """Distinct nodes evaluated in sequence never share a cached result."""
+    tc = TypeChecker()
+    results = [tc._evaluate_static_expression(Literal(str(n), "integer")) for n in range(50)]
+    assert results == list(range(50))
+
+
+@pytest.mark.unit
+def test_static_program_is_lowered_once_and_loads_parameters_at_run_time() -> None:
+    """Programs are reused within a check; parameter values are read when run."""
+    tc = TypeChecker()
+    condition = BinaryOp(">", Variable("x"), Literal("5", "integer"))
+
+    tc.static_values["x"] = Literal("10", "integer")
+    assert tc._evaluate_static_expression(condition) is True
+    program = tc._static_program(condition)
+
+    # Resetting the values keeps the lowered program.
+    tc._static_eval_cache = {}
+    tc.static_values["x"] = Literal("1", "integer")
+    assert tc._evaluate_static_expression(condition) is False
+    assert tc._static_program(condition) is program
+
+    # Programs are keyed by node id, so each check_model run starts afresh.
+    tc.check_model(Model(name="M"))
+    assert tc._static_programs == {}
+
+
+@pytest.mark.unit
+def test_evaluate_static_unknown_operator_returns_none() -> None:
+    tc = TypeChecker()
+    expr = BinaryOp("%", Literal("7", "integer"), Literal("2", "integer"))
+    assert tc._evaluate_static_expression(expr) is None
+
+
+@pytest.mark.unit
+def test_static_free_vars_lists_loaded_parameters() -> None:
+    tc = TypeChecker()
+    expr = BinaryOp("<", UnaryOp("-", Variable("a")), BinaryOp("+", Variable("b"), Literal("1", "integer")))
+    assert tc._static_free_vars(expr) == frozenset({"a", "b"})
+    assert tc._static_free_vars(Literal("1", "integer")) == frozenset()
+
+
+@pytest.mark.unit
+def test_evaluate_static_currency_literal_plain_and_patterned_amounts() -> None:
+    """Plain amounts and amounts with decimals, suffixes or separators."""
+    tc = TypeChecker()
+    assert tc._evaluate_static_expression(Literal("$250", "currency")) == 250.0
+    assert tc._evaluate_static_expression(Literal("€99.5", "currency")) == 99.5
+    assert tc._evaluate_static_expression(Literal("$10/1mo", "rate")) == 10.0
+    assert tc._evaluate_static_expression(Literal("$", "currency")) is None
+
+
+@pytest.mark.unit
+def test_evaluate_static_deeply_nested_expression() -> None:
+    """Nesting deeper than the recursion limit still evaluates."""
+    import sys
+
+    tc = TypeChecker()
+    expr = Literal("0", "integer")
+    for _ in range(sys.getrecursionlimit() + 100):
+        expr = BinaryOp("+", expr, Literal("1", "integer"))
+    assert tc._evaluate_static_expression(expr) == sys.getrecursionlimit() + 100
+    assert tc._evaluate_static_expression(BinaryOp("-", Literal("5", "integer"), UnaryOp("-", Literal("2", "integer")))) == 7
+
+
+@pytest.mark.unit
+def test_static_program_folds_parameter_free_subtrees() -> None:
+    """Literal-only subtrees are folded into a single constant."""
+    tc = TypeChecker()
+    tc.static_values = {"x": Literal("4", "integer")}
+    folded = BinaryOp("*", BinaryOp("+", Literal("1", "integer"), Literal("2", "integer")), UnaryOp("-", Literal("3", "integer")))
+    mixed = BinaryOp("+", Variable("x"), BinaryOp("*", Literal("2", "integer"), Literal("5", "integer")))
+
+    assert len(tc._static_program(folded)) == 1
+    assert tc._evaluate_static_expression(folded) == -9
+    assert len(tc._static_program(mixed)) == 3
+    assert tc._evaluate_static_expression(mixed) == 14
+    assert tc._evaluate_static_expression(BinaryOp("/", Literal("1", "integer"), Literal("0", "integer"))) is None
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+
+import pytest
+
+from compiler.ast_nodes import BinaryOp, Literal, TypeAnnotation, Variable
+from compiler.typechecker import Dimension, PELType, TypeChecker
+
+
+@pytest.mark.unit
+def test_common_type_factories_return_shared_instances() -> None:
+    assert PELType.fraction() is PELType.fraction()
+    assert PELType.boolean() is PELType.boolean()
+    assert PELType.integer() is PELType.integer()
+    assert PELType.currency("USD") is PELType.currency("USD")
+    assert PELType.rate("Month") is PELType.rate("Month")
+    assert PELType.duration("Year") is PELType.duration("Year")
+    assert PELType.duration() is PELType.duration(None)
+
+
+@pytest.mark.unit
+def test_uncommon_type_parameters_still_build_equal_types() -> None:
+    chf = PELType.currency("CHF")
+    assert chf == PELType.currency("CHF")
+    assert chf.params == {"currency_code": "CHF"}
+    assert chf.dimension.units == {"currency": "CHF"}
+
+
+@pytest.mark.unit
+def test_parameterised_type_tables_stay_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    from compiler import typechecker
+
+    tables = ["_CURRENCY_TYPES", "_RATE_TYPES", "_DURATION_TYPES", "_COUNT_TYPES", "_CAPACITY_TYPES"]
+    for name in tables + ["_SINGLE_TAG_DIMENSIONS"]:
+        monkeypatch.setattr(typechecker, name, {})
+    monkeypatch.setattr(typechecker, "_MEMO_LIMIT", 2)
+
+    for i in range(5):
+        assert PELType.currency(f"C{i}").params == {"currency_code": f"C{i}"}
+        assert PELType.rate(f"U{i}").dimension == Dimension.rate(f"U{i}")
+        assert PELType.duration(f"U{i}").params == {"unit": f"U{i}"}
+        assert PELType.count(f"E{i}").params == {"entity": f"E{i}"}
+        assert PELType.capacity(f"R{i}").params == {"resource": f"R{i}"}
+    for name in tables + ["_SINGLE_TAG_DIMENSIONS"]:
+        assert len(getattr(typechecker, name)) <= 2
+
+
+@pytest.mark.unit
+def test_peltype_is_immutable() -> None:
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        PELType.fraction().type_kind = "Boolean"  # type: ignore[misc]
+
+
+@pytest.mark.unit
+def test_pel_type_to_ast_type_does_not_share_params_with_shared_types() -> None:
+    tc = TypeChecker()
+    usd = PELType.currency("USD")
+
+    annotation = tc.pel_type_to_ast_type(usd)
+    annotation.params["currency_code"] = "EUR"
+
+    assert usd.params == {"currency_code": "USD"}
+
+
+@pytest.mark.unit
+def test_integer_literals_share_the_int_type() -> None:
+    tc = TypeChecker()
+    first = tc.infer_literal(Literal(value="1", literal_type="integer"))
+    second = tc.infer_literal(Literal(value="2", literal_type="integer"))
+    assert first is second is PELType.integer()
+    assert first.type_kind == "Int"
+    assert first.dimension.units == {}
+
+
+@pytest.mark.unit
+def test_dimensionless_is_shared_and_identity_short_circuits() -> None:
+    tc = TypeChecker()
+    assert Dimension.dimensionless() is Dimension.dimensionless()
+    assert PELType.fraction().dimension is PELType.integer().dimension
+    assert tc.dimensions_compatible(Dimension.dimensionless(), Dimension.dimensionless())
+    assert tc.types_compatible(PELType.count(), PELType.count()) is True
+
+
+@pytest.mark.unit
+def test_type_text_is_formatted_once_and_excluded_from_equality() -> None:
+    chf = PELType.currency("CHF")
+    assert str(chf) == "Currency<currency_code=CHF>"
+    assert chf._text == "Currency<currency_code=CHF>"
+    assert chf == PELType.currency("CHF")
+
+
+@pytest.mark.unit
+def test_parameterised_types_and_dimensions_are_interned_on_first_use() -> None:
+    assert PELType.currency("CHF") is PELType.currency("CHF")
+    assert PELType.rate("Fortnight") is PELType.rate("Fortnight")
+    assert PELType.count("Customer", "Month") is PELType.count("Customer", "Month")
+    assert PELType.count("Customer") is not PELType.count("Customer", "Month")
+    assert PELType.capacity("Seats") is PELType.capacity("Seats")
+    assert PELType.capacity() is not PELType.capacity("Seats")
+    assert Dimension.count("Customer") is Dimension.count("Customer")
+    assert Dimension.duration() is Dimension.duration("generic")
+    assert Dimension.currency("CHF") is PELType.currency("CHF").dimension
+
+
+@pytest.mark.unit
+def test_peltype_equality_compares_kind_dimension_and_params() -> None:
+    usd_series = PELType.timeseries(PELType.currency("USD"))
+    assert usd_series == PELType.timeseries(PELType.currency("USD"))
+    assert usd_series != PELType.timeseries(PELType.currency("EUR"))
+    assert PELType.count("Customer") != PELType.capacity("Customer")
+    assert PELType.capacity() != PELType.count()
+    assert PELType.fraction() != "Fraction"
+
+
+@pytest.mark.unit
+def test_identical_types_are_compatible_without_the_kind_rules(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: object) -> bool:
+        raise AssertionError("identity fast path not taken")
+
+    monkeypatch.setattr(TypeChecker, "_same_kind_compatible", fail)
+    tc = TypeChecker()
+    usd = PELType.currency("USD")
+    assert tc.types_compatible(usd, PELType.currency("USD")) is True
+    assert tc.types_compatible(PELType.rate("Month"), PELType.rate("Month")) is True
+    assert tc.dimensions_compatible(usd.dimension, Dimension.currency("USD")) is True
+
+
+@pytest.mark.unit
+def test_fixed_literal_kinds_share_their_types() -> None:
+    tc = TypeChecker()
+    first = tc.infer_literal(Literal(value="a", literal_type="string"))
+    assert first is tc.infer_literal(Literal(value="b", literal_type="string"))
+    assert first.type_kind == "String"
+    assert tc.infer_literal(Literal(value=0.05, literal_type="percentage")) is PELType.fraction()
+
+
+@pytest.mark.unit
+def test_fallback_annotation_kinds_are_interned() -> None:
+    kind = "".join(["Prob", "ability"])
+    pel_type = TypeChecker().ast_type_to_pel_type(TypeAnnotation(type_kind=kind))
+    assert pel_type.type_kind is sys.intern("Probability")
+
+
+@pytest.mark.unit
+def test_wrapper_types_are_interned_by_inner_type() -> None:
+    tc = TypeChecker()
+    series = TypeAnnotation(type_kind="TimeSeries", params={"inner": TypeAnnotation(type_kind="Currency", params={"currency_code": "USD"})})
+
+    assert tc.ast_type_to_pel_type(series) is PELType.timeseries(PELType.currency("USD"))
+    assert PELType.distribution(PELType.rate("Month")) is PELType.distribution(PELType.rate("Month"))
+    assert PELType.array(PELType.array(PELType.integer())) is PELType.array(PELType.array(PELType.integer()))
+    assert PELType.timeseries(PELType.fraction()) is not PELType.distribution(PELType.fraction())
+    assert hash(PELType.currency("USD")) == hash(PELType.currency("USD"))
+
+
+@pytest.mark.unit
+def test_wrapper_type_table_stays_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    from compiler import typechecker
+
+    monkeypatch.setattr(typechecker, "_WRAPPER_TYPES", {})
+    monkeypatch.setattr(typechecker, "_MEMO_LIMIT", 2)
+    for i in range(5):
+        inner = PELType.product(Dimension.count(f"Entity{i}"))
+        assert PELType.timeseries(inner).params == {"inner": inner}
+        assert PELType.array(inner).params == {"element_type": inner}
+    assert len(typechecker._WRAPPER_TYPES) <= 2
+
+
+@pytest.mark.unit
+def test_derived_product_and_quotient_types_are_interned() -> None:
+    tc = TypeChecker()
+    tc.env.bind("usd", PELType.currency("USD"))
+    tc.env.bind("months", PELType.duration("Month"))
+    first = tc.infer_expression(BinaryOp(operator="/", left=Variable(name="months"), right=Variable(name="usd")))
+    second = tc.infer_expression(BinaryOp(operator="/", left=Variable(name="months"), right=Variable(name="usd")))
+
+    assert first.type_kind == "Quotient"
+    assert first is second
+    assert PELType.product(first.dimension) is not PELType.quotient(first.dimension)
+
+
+@pytest.mark.unit
+def test_derived_type_table_stays_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    from compiler import typechecker
+
+    monkeypatch.setattr(typechecker, "_MEMO_LIMIT", 2)
+    for i in range(5):
+        dimension = Dimension.count(f"Entity{i}")
+        assert PELType.product(dimension).dimension == dimension
+    assert len(typechecker._DERIVED_TYPES) <= 2
+
+
+@pytest.mark.unit
+def test_currency_literals_map_their_symbol_to_a_shared_type() -> None:
+    tc = TypeChecker()
+    assert tc.infer_literal(Literal(value="€5", literal_type="currency")) is PELType.currency("EUR")
+    assert tc.infer_literal(Literal(value="£5", literal_type="currency")) is PELType.currency("GBP")
+    assert tc.infer_literal(Literal(value="¥5", literal_type="currency")) is PELType.currency("USD")
+
+
+@pytest.mark.unit
+def test_known_parameterless_annotations_share_their_types() -> None:
+    tc = TypeChecker()
+    assert tc.ast_type_to_pel_type(TypeAnnotation(type_kind="Int")) is PELType.integer()
+    string = tc.ast_type_to_pel_type(TypeAnnotation(type_kind="String"))
+    assert string is tc.ast_type_to_pel_type(TypeAnnotation(type_kind="String"))
+    first = tc.ast_type_to_pel_type(TypeAnnotation(type_kind="Probability"))
+    assert first == tc.ast_type_to_pel_type(TypeAnnotation(type_kind="Probability"))
+    assert first.params == {}
+
+    from compiler import typechecker
+    assert "Probability" not in typechecker._PLAIN_TYPES
+
+    tagged = tc.ast_type_to_pel_type(TypeAnnotation(type_kind="Probability", params={"of": "Churn"}))
+    assert tagged.params == {"of": "Churn"}
+    assert tagged != first
+
+
+@pytest.mark.unit
+def test_nested_wrapper_annotations_are_converted_in_one_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    factories = {"TimeSeries": PELType.timeseries, "Distribution": PELType.distribution, "Array": PELType.array}
+    annotation = TypeAnnotation(type_kind="Currency", params={"currency_code": "EUR"})
+    expected = PELType.currency("EUR")
+    for level in range(30):
+        kind = ("TimeSeries", "Distribution", "Array")[level % 3]
+        annotation = TypeAnnotation(type_kind=kind, params={"inner": annotation})
+        expected = factories[kind](expected)
+
+    calls = 0
+    original = TypeChecker.ast_type_to_pel_type
+
+    def counting(self: TypeChecker, ast_type: TypeAnnotation) -> PELType:
+        nonlocal calls
+        calls += 1
+        return original(self, ast_type)
+
+    monkeypatch.setattr(TypeChecker, "ast_type_to_pel_type", counting)
+    tc = TypeChecker()
+    calls = 0
+    assert tc.ast_type_to_pel_type(annotation) is expected
+    # The outer call plus one for the innermost Currency annotation
+    assert calls == 2
+
+    array_of_bool = TypeAnnotation(type_kind="Array", params={"inner": PELType.boolean()})
+    series_of_bool = TypeAnnotation(type_kind="TimeSeries", params={"inner": PELType.boolean()})
+    assert tc.ast_type_to_pel_type(array_of_bool) is PELType.array(PELType.boolean())
+    assert tc.ast_type_to_pel_type(series_of_bool) is PELType.timeseries(PELType.fraction())